@@ -1,9 +1,12 @@
-from colorama import Fore, Style
 import serial
 import logging
 
 logger = logging.getLogger(__name__)
 
+COLOR_OKGREEN = "\033[32m"
+COLOR_FAIL = "\033[31m"
+COLOR_ENDC = "\033[0m"
+
 
 class PTT:
     def __init__(self, port, baud_rate, ptt_signal, test_mode):
@@ -13,26 +16,39 @@ class PTT:
         if self.test_mode:
             logger.info("Test mode enabled, skipping serial port usage")
         else:
-            try:
-                self.ser = serial.Serial(port, baud_rate)
-            except serial.SerialException:
-                # sudo gpasswd --add ${USER} dialout
-                log = f"{Fore.RED}Failed to open serial port %s@%i\n{Style.RESET_ALL}"
-                logger.error(log, port, baud_rate)
+            # The port is opened only for transmission: opening asserts DTR and
+            # RTS by default, which would key the transmitter between bulletins
+            # in daemon mode.
+            self.ser = serial.Serial()
+            self.ser.port = port
+            self.ser.baudrate = baud_rate
+            self.ser.dtr = False
+            self.ser.rts = False
 
     def press(self):
         if self.ser:
+            if not self.ser.is_open:
+                try:
+                    self.ser.open()
+                except serial.SerialException:
+                    # sudo gpasswd --add ${USER} dialout
+                    log = f"{COLOR_FAIL}Failed to open serial port %s@%i\n{COLOR_ENDC}"
+                    logger.error(log, self.ser.port, self.ser.baudrate)
+                    return
             if self.ptt_signal == "DTR":
-                logger.info(f"{Fore.GREEN}DTR/PTT set to ON\n{Style.RESET_ALL}")
+                logger.info(f"{COLOR_OKGREEN}DTR/PTT set to ON\n{COLOR_ENDC}")
                 self.ser.dtr = True
                 self.ser.rts = False
             else:
-                logger.info(f"{Fore.GREEN}RTS/PTT set to ON\n{Style.RESET_ALL}")
+                logger.info(f"{COLOR_OKGREEN}RTS/PTT set to ON\n{COLOR_ENDC}")
                 self.ser.dtr = False
                 self.ser.rts = True
 
     def release(self):
         # If we've opened serial it's now time to close it.
-        if self.ser:
+        if self.ser and self.ser.is_open:
+            # opened with both lines off next time
+            self.ser.dtr = False
+            self.ser.rts = False
             self.ser.close()
-            logger.info(f"{Fore.GREEN}RTS/PTT set to OFF\n{Style.RESET_ALL}")
+            logger.info(f"{COLOR_OKGREEN}RTS/PTT set to OFF\n{COLOR_ENDC}")
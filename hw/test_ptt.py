@@ -0,0 +1,90 @@
+import unittest
+from unittest import mock
+
+from hw import ptt
+
+
+class FakeSerial:
+    """Serial port which records states of its control lines; like pyserial,
+    it sets the lines when opened"""
+
+    def __init__(self):
+        self.port = None
+        self.baudrate = 9600
+        self.is_open = False
+        self._dtr = self._rts = True
+        self.asserted = []
+        self.opened = []
+
+    def _update(self):
+        if self.is_open:
+            self.asserted.append((self._dtr, self._rts))
+
+    @property
+    def dtr(self):
+        return self._dtr
+
+    @dtr.setter
+    def dtr(self, value):
+        self._dtr = value
+        self._update()
+
+    @property
+    def rts(self):
+        return self._rts
+
+    @rts.setter
+    def rts(self, value):
+        self._rts = value
+        self._update()
+
+    def open(self):
+        self.is_open = True
+        self.opened.append((self._dtr, self._rts))
+        self._update()
+
+    def close(self):
+        self.is_open = False
+
+    def keyed(self):
+        return self.is_open and (self._dtr or self._rts)
+
+
+class TestPTT(unittest.TestCase):
+    """Tests of keying the transmitter through a serial port"""
+
+    def create(self, signal):
+        with mock.patch("serial.Serial", FakeSerial):
+            return ptt.PTT("/dev/ttyS0", 9600, signal, False)
+
+    def test_not_keyed_between_bulletins(self):
+        """No control line is asserted before and between bulletins"""
+        for signal, keyed in (("DTR", (True, False)), ("RTS", (False, True))):
+            p = self.create(signal)
+            self.assertFalse(p.ser.keyed())
+            for _ in range(2):
+                p.press()
+                self.assertTrue(p.ser.keyed())
+                self.assertEqual(p.ser.asserted[-1], keyed)
+                p.release()
+                self.assertFalse(p.ser.keyed())
+            # the port is opened with both lines off
+            self.assertEqual(p.ser.opened, [(False, False), (False, False)])
+
+    def test_release_without_press(self):
+        """Releasing PTT which wasn't pressed doesn't open the port"""
+        p = self.create("DTR")
+        p.release()
+        self.assertFalse(p.ser.is_open)
+        self.assertEqual(p.ser.asserted, [])
+
+    def test_test_mode(self):
+        """Serial port isn't used in test mode"""
+        p = ptt.PTT("/dev/ttyS0", 9600, "DTR", True)
+        p.press()
+        p.release()
+        self.assertIsNone(p.ser)
+
+
+if __name__ == "__main__":
+    unittest.main()
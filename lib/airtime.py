@@ -0,0 +1,150 @@
+"""Airtime estimation and bulletin planning.
+
+Length of a bulletin is known before PTT is keyed, mostly without decoding any
+audio: sample lengths come from the sample bank index or, for samples which
+aren't in the bank, from the Ogg container (granule position of the last page of
+a Vorbis stream is its number of PCM frames, as ``pygame`` decodes it). Samples
+at other rates than the mixer's are decoded, as resampling may change their
+length by a few hundred frames. ``plan()`` fits plugins' messages into the
+maximum airtime, trimming or dropping the least important ones.
+"""
+
+import logging
+import os
+
+from lib import segments
+
+logger = logging.getLogger(__name__)
+
+# the last Ogg page is at most ~64kB long
+OGG_TAIL_SIZE = 65536 + 27 + 255
+
+
+def ogg_frames(path):
+    """Returns the number of PCM frames and the sampling rate of an Ogg Vorbis
+    file, reading only its first and last pages."""
+    with open(path, "rb") as f:
+        head = f.read(512)
+        f.seek(max(os.fstat(f.fileno()).st_size - OGG_TAIL_SIZE, 0))
+        tail = f.read()
+
+    header = head.find(b"\x01vorbis")
+    if not head.startswith(b"OggS") or header < 0:
+        raise ValueError(f"{path} isn't an Ogg Vorbis file")
+    # identification header: packet type, "vorbis", version, channels, rate
+    sampling_frequency = int.from_bytes(head[header + 12 : header + 16], "little")
+
+    last_page = tail.rfind(b"OggS")
+    if last_page < 0 or sampling_frequency == 0:
+        raise ValueError(f"{path} isn't an Ogg Vorbis file")
+    granule = int.from_bytes(tail[last_page + 6 : last_page + 14], "little")
+    return granule, sampling_frequency
+
+
+def ogg_duration(path):
+    """Returns duration of an Ogg Vorbis file in seconds."""
+    frames, sampling_frequency = ogg_frames(path)
+    return frames / sampling_frequency
+
+
+class SampleDurations:
+    """Lengths of samples, in frames at ``sampling_frequency``, by sample id.
+
+    Lengths are taken from samples already loaded into ``sound_samples``, from
+    ``sample_bank``, from PCM of generated samples (``generate(name)``, which
+    returns ``None`` for other ones), from trim points in ``sample_levels`` or
+    from Ogg headers of files given by ``sample_path(name)``. Files at another
+    sampling rate are decoded with ``decode(path)``, if it's given, and kept in
+    ``sound_samples``.
+    """
+
+    def __init__(
+        self,
+        sampling_frequency,
+        sample_path,
+        sample_bank=None,
+        sound_samples=None,
+        generate=None,
+        sample_levels=None,
+        decode=None,
+    ):
+        self.sampling_frequency = sampling_frequency
+        self._sample_path = sample_path
+        self._sample_bank = sample_bank
+        self._sound_samples = {} if sound_samples is None else sound_samples
+        self._generate = generate or (lambda name: None)
+        self._sample_levels = sample_levels
+        self._decode = decode
+        self._frames = {}
+
+    def __call__(self, sample_id):
+        if sample_id in self._sound_samples:
+            return len(self._sound_samples[sample_id])
+        try:
+            return self._frames[sample_id]
+        except KeyError:
+            pass
+
+        name = segments.name(sample_id)
+        generated = self._generate(name)
+        if generated is not None:
+            frames = len(generated)
+        elif self._sample_bank is not None and name in self._sample_bank:
+            frames = self._sample_bank.length(name)
+        else:
+            duration = None
+            if self._sample_levels is not None:
+                duration = self._sample_levels.duration(name)
+            if duration is not None:
+                frames = round(duration * self.sampling_frequency)
+            else:
+                frames = self._file_frames(sample_id, name)
+        self._frames[sample_id] = frames
+        return frames
+
+    def _file_frames(self, sample_id, name):
+        path = self._sample_path(name)
+        try:
+            frames, sampling_frequency = ogg_frames(path)
+        except (OSError, ValueError):
+            logger.warning("Couldn't get length of %s", name)
+            return 0
+        if sampling_frequency == self.sampling_frequency:
+            return frames
+        if self._decode is not None:
+            pcm = self._decode(path)
+            self._sound_samples[sample_id] = pcm
+            return len(pcm)
+        return round(frames * self.sampling_frequency / sampling_frequency)
+
+
+def plan(parts, budget, durations):
+    """Fits messages of ``parts`` in ``budget`` frames.
+
+    ``parts`` is a list of ``(name, priority, message)`` in bulletin order. As
+    long as the total is too long, the part of the lowest priority (the later
+    one, among equal priorities) is trimmed at a pause or, if nothing of it
+    fits, dropped. Returns the list of messages (empty ones for dropped parts).
+    """
+    rate = durations.sampling_frequency
+    messages = [message for _, _, message in parts]
+    lengths = [message.frames(durations, rate) for message in messages]
+    excess = sum(lengths) - budget
+
+    by_importance = sorted(range(len(parts)), key=lambda i: (parts[i][1], -i))
+    for index in by_importance:
+        if excess <= 0:
+            break
+        name = parts[index][0]
+        trimmed = messages[index].truncated(lengths[index] - excess, durations, rate)
+        if any(kind != segments.SILENCE for kind in trimmed.kinds):
+            logger.warning("Trimmed %s to fit in airtime", name)
+        else:
+            logger.warning("Dropped %s to fit in airtime", name)
+            trimmed = segments.Message()
+        length = trimmed.frames(durations, rate)
+        excess -= lengths[index] - length
+        messages[index], lengths[index] = trimmed, length
+    if excess > 0:
+        logger.warning("Bulletin is too long even without plugins' messages")
+    return messages
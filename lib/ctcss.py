@@ -20,7 +20,7 @@
 # (http://hamradio.pl/sq9jdo/_Kurs/Kurs%20operatora/CTCSS/system_ctcss.html).
 # Please, do not modify this if you're living in Region I.
 
-import numpy.oldnumeric as Numeric
+import numpy
 
 CTCSSTones = {
     "A": 67.0,
@@ -64,15 +64,26 @@ CTCSSTones = {
 }
 
 
+def ctcssTone(tone, length, sampleRate=44100, amplitude=0.9 * 32767, phase=0.0):
+    """Returns ``length`` samples (mono, int16) of a CTCSS ``tone``.
+
+    The tone is generated in one go for the whole length, so it's phase-continuous
+    and doesn't click like a looped, fixed-size buffer does. ``phase`` (in radians)
+    lets you continue a previously generated tone.
+    """
+    if tone in CTCSSTones:
+        tone = CTCSSTones[tone]
+    omega = 2 * numpy.pi * float(tone) / sampleRate
+    xvalues = numpy.arange(length) * omega + phase
+    return (amplitude * numpy.sin(xvalues)).astype(numpy.int16)
+
+
 # http://www.nabble.com/Chord-player-td21350708.html
 def getCTCSS(tone, sampleRate=44100, peak=0.9):
     if tone in CTCSSTones:
         tone = CTCSSTones[tone]
-    length = sampleRate / float(tone)
-    omega = Numeric.pi * 2 / length
-    xvalues = Numeric.arange(int(length)) * omega
-    oneCycle = ((peak * 32767) * Numeric.sin(xvalues)).astype(Numeric.Int16)
-    return Numeric.transpose(Numeric.array((oneCycle, oneCycle)))
+    oneCycle = ctcssTone(tone, int(sampleRate / float(tone)), sampleRate, peak * 32767)
+    return numpy.column_stack((oneCycle, oneCycle))
 
 
 def main():
@@ -84,8 +95,10 @@ def main():
     print("Testing CTCSS capability")
     for tone in sorted(CTCSSTones.keys()):
         print("Tone %s, %s Hz..." % (tone, CTCSSTones[tone]))
-        s = pygame.sndarray.make_sound(getCTCSS(CTCSSTones[tone]))
-        c = s.play(300)
+        s = pygame.sndarray.make_sound(
+            numpy.repeat(ctcssTone(tone, 3 * 44100)[:, numpy.newaxis], 2, axis=1)
+        )
+        c = s.play()
         while c.get_busy():
             pygame.time.wait(25)
 
@@ -16,7 +16,9 @@
 #   limitations under the License.
 #
 
-import numpy.oldnumeric as Numeric
+import functools
+
+import numpy
 
 morse = {
     "A": ".-",
@@ -58,7 +60,7 @@ morse = {
     # I have plans with special characters, ie make them sound like _SK_,
     # _AR_, etc ...
     ".": ".-.-.-",
-    ", ": "--..--",
+    ",": "--..--",
     "'": ".----.",
     "_": "..--.-",
     ":": "---...",
@@ -85,31 +87,14 @@ morse = {
 }
 
 
-def cw(
-    text, wpm=25, farnsworth=None, weight=None, pitch=600, volume=0.1, sampleRate=44100
-):
-    # Would be nice to cope with farnsworth<0 ==> slow down by ... WPM
-    # Would be nice to implement weight
-
-    text = text.upper()
-    if farnsworth is not None:
-        try:
-            farnsworth = abs(farnsworth)
-            if farnsworth > wpm:
-                farnsworth = wpm
-        except ValueError:
-            farnsworth = wpm
-            pass
-    else:
-        farnsworth = wpm
+# raised-cosine rise and fall time of beeps (removes key clicks)
+RISE_TIME = 0.005
 
-    volume = abs(volume)
-    if volume > 1.0:
-        volume = 1.0
-
-    if sampleRate not in (11025, 22050, 44100):
-        sampleRate = 44100
 
+@functools.lru_cache(maxsize=16)
+def _elements(wpm, farnsworth, pitch, volume, sampleRate):
+    """Returns shaped beeps (``{".": dit, "-": dah}``) and lengths (in samples) of
+    pauses between beeps, letters and words, for the given speed and tone."""
     # First of all we have to count lengths of pauses, "dits" and "dahs".
     # There are three kinds of pauses: between dits and dahs (interBeep),
     # between letters (interLetter) and between words (interWord).
@@ -131,75 +116,81 @@ def cw(
     # 0.23999999999999999
     #
     # 1 unit is 0.24 seconds long.
-    #
-    # This function returns ``pygame.sndarray`` compatible data (``Numeric.aray``).
-    unit = 60.0 / (50 * wpm)
-
-    interBeep = Numeric.zeros((int(unit * sampleRate)))
+    unit = int(60.0 / (50 * wpm) * sampleRate)
     # Farnsworth (after Farnsworth method, see Google) lest us to make interLetter
     # and interWord pauses longer, but we need to recalculate ``unit``'s length:
-
     fUnit = 60.0 / (50 * farnsworth)
-    interLetter = Numeric.zeros((int(2 * fUnit * sampleRate)))
-    interWord = Numeric.zeros((int(3 * fUnit * sampleRate)))
+    interLetter = int(2 * fUnit * sampleRate)
+    interWord = int(3 * fUnit * sampleRate)
 
-    dit = Numeric.concatenate(
-        (sine_array(pitch, volume, sampleRate, 1 * unit), interBeep)
-    )
-    dah = Numeric.concatenate(
-        (sine_array(pitch, volume, sampleRate, 3 * unit), interBeep)
-    )
+    rise = min(int(RISE_TIME * sampleRate), unit // 2)
+    ramp = 0.5 - 0.5 * numpy.cos(numpy.pi * numpy.arange(rise) / max(rise, 1))
 
-    letters = {}
-
-    for letter in set(text.replace(" ", "")):
-        if letter in morse:
-            for beep in morse[letter]:
-                if beep == ".":
-                    if letter in letters:
-                        letters[letter] = Numeric.concatenate((letters[letter], dit))
-                    else:
-                        letters[letter] = dit
-                else:
-                    if letter in letters:
-                        letters[letter] = Numeric.concatenate((letters[letter], dah))
-                    else:
-                        letters[letter] = dah
-            letters[letter] = Numeric.concatenate((letters[letter], interLetter))
-
-    message = interBeep
-    for letter in text:
-        if letter != " " and letter in morse:
-            message = Numeric.concatenate((message, letters[letter]))
-        else:
-            message = Numeric.concatenate((message, interWord))
+    def beep(length):
+        wave = numpy.sin(2 * numpy.pi * pitch / sampleRate * numpy.arange(length))
+        wave[:rise] *= ramp
+        wave[length - rise :] *= ramp[::-1]
+        wave = (volume * 32767 * wave).astype(numpy.int16)
+        wave.flags.writeable = False
+        return wave
 
-    return Numeric.transpose(Numeric.array((message, message)))
+    return {".": beep(unit), "-": beep(3 * unit)}, unit, interLetter, interWord
 
 
-# http://www.nabble.com/Chord-player-td21350708.html
-def sine_array_onecycle(hz, peak=0.9, sampleRate=44100):
-    # Compute one cycle of an N-Hz sine wave with given peak amplitude
-    length = sampleRate / float(hz)
-    omega = Numeric.pi * 2 / length
-    xvalues = Numeric.arange(int(length)) * omega
-    return ((peak * 32767) * Numeric.sin(xvalues)).astype(Numeric.Int16)
+@functools.lru_cache(maxsize=32)
+def cw(
+    text, wpm=25, farnsworth=None, weight=None, pitch=600, volume=0.1, sampleRate=44100
+):
+    """Returns ``text`` in Morse code as PCM samples (mono, int16).
+
+    Beeps are precomputed once per speed and tone and whole texts are cached too,
+    so rendering the same callsign again costs nothing. The returned array is
+    read-only.
+    """
+    # Would be nice to cope with farnsworth<0 ==> slow down by ... WPM
+    # Would be nice to implement weight
+
+    text = text.upper()
+    if farnsworth is not None:
+        farnsworth = min(abs(farnsworth), wpm)
+    else:
+        farnsworth = wpm
 
+    volume = min(abs(volume), 1.0)
 
-def sine_array(hz, peak, sampleRate=44100, length=1.0):
-    # Compute N samples of a sine wave with given frequency and peak amplitude (defaults to one second).
-    return Numeric.resize(sine_array_onecycle(hz, peak), (int(sampleRate * length),))
+    beeps, interBeep, interLetter, interWord = _elements(
+        wpm, farnsworth, pitch, volume, sampleRate
+    )
+
+    # positions of beeps are computed first, so the message is written into one
+    # buffer of the right size
+    placed = []
+    position = interBeep
+    for letter in text:
+        if letter != " " and letter in morse:
+            for element in morse[letter]:
+                placed.append((position, beeps[element]))
+                position += len(beeps[element]) + interBeep
+            position += interLetter
+        else:
+            position += interWord
+
+    message = numpy.zeros(position, numpy.int16)
+    for position, beep in placed:
+        message[position : position + len(beep)] = beep
+    message.flags.writeable = False
+    return message
 
 
 def play(
     text, wpm=25, farnsworth=None, weight=None, pitch=800, volume=1, sampleRate=44100
 ):
+    import pygame
+
+    channels = pygame.mixer.get_init()[2]
+    pcm = cw(text, wpm, farnsworth, weight, pitch, volume, sampleRate)
     s = pygame.sndarray.make_sound(
-        cw(text, wpm, farnsworth, weight, pitch, volume, sampleRate)
-    )
-    # uncomment this line if you hear cw playing twice.
-    s = pygame.sndarray.make_sound(
-        pygame.sndarray.array(s)[: len(pygame.sndarray.array(s)) / 2]
+        numpy.repeat(pcm[:, numpy.newaxis], channels, axis=1)
     )
     c = s.play()
     while c.get_busy():
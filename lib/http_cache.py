@@ -0,0 +1,148 @@
+"""Shared on-disk HTTP response cache.
+
+Plugins download their data with ``get()``. Responses are kept on disk and reused
+for ``ttl`` seconds without any network round-trip. Older entries are revalidated
+with ``If-None-Match``/``If-Modified-Since``, so unchanged data isn't downloaded
+again. If the source can't be reached, the stale copy is used, but only for a
+limited time (``max_stale``), so data of a source which is down isn't passed off
+as current. The cache is limited in size, least recently used entries are
+evicted first.
+
+Caching is disabled (every call goes to the network) until ``configure()`` is
+called.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+
+from lib import http_client
+
+logger = logging.getLogger(__name__)
+
+_directory = None
+_max_size = 50 * 1024 * 1024
+_stale_factor = 3
+_lock = threading.Lock()
+
+
+def configure(directory="cache", max_size=50 * 1024 * 1024, stale_factor=3):
+    """Enables caching in ``directory``, limited to ``max_size`` bytes. Stale
+    copies are used for at most ``stale_factor`` times their ``ttl`` by
+    default."""
+    global _directory, _max_size, _stale_factor
+    os.makedirs(directory, exist_ok=True)
+    _directory = directory
+    _max_size = max_size
+    _stale_factor = stale_factor
+
+
+def _entry_path(url):
+    return os.path.join(_directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+
+def _load(url):
+    path = _entry_path(url)
+    try:
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(path + ".body", "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    if meta.get("url") != url:
+        return None, None
+    # mark entry as recently used
+    os.utime(path + ".body")
+    return meta, body
+
+
+def _store(url, meta, body):
+    path = _entry_path(url)
+    tmp_suffix = f".{threading.get_ident()}.tmp"
+    with open(path + ".body" + tmp_suffix, "wb") as f:
+        f.write(body)
+    with open(path + ".json" + tmp_suffix, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(path + ".body" + tmp_suffix, path + ".body")
+    os.replace(path + ".json" + tmp_suffix, path + ".json")
+    _evict()
+
+
+def _evict():
+    with _lock:
+        entries = []
+        total = 0
+        with os.scandir(_directory) as it:
+            for entry in it:
+                if entry.name.endswith(".body"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        while total > _max_size and entries:
+            _, size, path = entries.pop(0)
+            for suffix in (".body", ".json"):
+                try:
+                    os.remove(path.removesuffix(".body") + suffix)
+                except FileNotFoundError:
+                    pass
+            total -= size
+            logger.debug("Evicted %s from HTTP cache", path)
+
+
+def get(url, ttl=0, timeout=None, headers=None, max_stale=None):
+    """Returns body of ``url``, from cache if it's younger than ``ttl`` seconds.
+
+    If data can't be downloaded, the cached copy is returned if it's younger
+    than ``max_stale`` seconds (by default ``stale_factor`` times ``ttl``, see
+    ``configure()``). Otherwise ``requests.RequestException`` is raised.
+    """
+    if _directory is None:
+        return http_client.get(url, headers, timeout)
+
+    meta, body = _load(url)
+    if meta is not None and time.time() - meta["fetched"] < ttl:
+        logger.debug("Cache hit: %s", url)
+        return body
+
+    request_headers = dict(headers or {})
+    if meta is not None:
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = http_client.request(url, request_headers, timeout)
+        if response.status_code == 304 and meta is not None:
+            logger.debug("Not modified: %s", url)
+            meta["fetched"] = time.time()
+            _store(url, meta, body)
+            return body
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if meta is None:
+            raise
+        if max_stale is None:
+            max_stale = _stale_factor * ttl
+        age = time.time() - meta["fetched"]
+        if age >= max_stale:
+            logger.warning("Couldn't refresh %s (%s), cached copy is too old", url, e)
+            raise
+        logger.warning("Couldn't refresh %s (%s), using cached copy", url, e)
+        return body
+
+    meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched": time.time(),
+    }
+    _store(url, meta, response.content)
+    return response.content
@@ -0,0 +1,134 @@
+"""Shared HTTP client.
+
+All plugins talk to their data sources through one ``requests.Session``, so TCP
+and TLS connections are kept alive and reused (pooled per host), responses are
+gzip-compressed where the server supports it, and every request gets the same
+timeout and retry policy (only 5xx responses are retried). A host which couldn't
+be connected to, or timed out, is marked unreachable after the first failure,
+until ``reset_reachability()``, so further requests to it fail immediately
+instead of waiting for another timeout. Use ``lib.http_cache.get()``
+for data which may be cached, and ``get()`` from here for requests which always
+have to reach the server.
+"""
+
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from lib import metrics
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "sr0wx (+https://github.com/iwane-pl/sr0wx)"
+
+_timeout = 30
+_retries = 2
+_pool_size = 10
+_session = None
+_unreachable = set()
+_lock = threading.Lock()
+
+
+def configure(timeout=30, retries=2, pool_size=10):
+    """Sets default ``timeout`` (in seconds), number of ``retries`` of failed
+    requests and number of kept-alive connections per host."""
+    global _timeout, _retries, _pool_size, _session
+    with _lock:
+        _timeout = timeout
+        _retries = retries
+        _pool_size = pool_size
+        _session = None
+
+
+def session():
+    """Returns the shared session, creating it on first use."""
+    global _session
+    with _lock:
+        if _session is None:
+            retry = Retry(
+                total=_retries,
+                # only error statuses are retried; a host which can't be
+                # connected to or doesn't answer in time is marked unreachable
+                # right away, a retry would cost another timeout
+                connect=0,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=("GET", "HEAD"),
+                # let callers see the final response status
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=_pool_size, pool_maxsize=_pool_size, max_retries=retry
+            )
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session.headers.update(
+                {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+            )
+        return _session
+
+
+def reset_reachability():
+    """Forgets unreachable hosts (e.g. before collecting data for a bulletin)."""
+    with _lock:
+        _unreachable.clear()
+
+
+def unreachable_hosts():
+    """Returns hosts which failed since the last ``reset_reachability()``."""
+    with _lock:
+        return set(_unreachable)
+
+
+def request(url, headers=None, timeout=None):
+    """Sends a GET request and returns the response, whatever its status is."""
+    host = urllib.parse.urlsplit(url).netloc
+    if host in _unreachable:
+        raise requests.ConnectionError(f"{host} is unreachable")
+
+    started = time.perf_counter()
+    try:
+        response = session().get(
+            url, headers=headers, timeout=_timeout if timeout is None else timeout
+        )
+    except (requests.ConnectionError, requests.Timeout):
+        logger.warning("%s is unreachable", host)
+        with _lock:
+            _unreachable.add(host)
+        raise
+    response.content  # read the whole body to measure the transfer
+    metrics.record_download(response.raw.tell(), time.perf_counter() - started)
+    return response
+
+
+def get(url, headers=None, timeout=None):
+    """Returns body of ``url``. Raises ``requests.RequestException`` on errors."""
+    response = request(url, headers, timeout)
+    response.raise_for_status()
+    return response.content
+
+
+class Executor(concurrent.futures.ThreadPoolExecutor):
+    """Thread pool for concurrent downloads. Tasks run in copies of the
+    submitter's context, so their downloads are still attributed to the calling
+    plugin."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def map_concurrently(fn, items, workers):
+    """Calls ``fn`` with each of ``items`` in up to ``workers`` threads (see
+    ``Executor``) and returns the finished futures in the order of ``items``, so
+    errors can be handled item by item."""
+    with Executor(workers) as executor:
+        return [executor.submit(fn, item) for item in items]
@@ -0,0 +1,148 @@
+"""Per-run performance metrics.
+
+Core records wall time of every phase of a run, plugins' fetch and parse times,
+bytes downloaded by each plugin and the final airtime. Downloads are attributed
+to the plugin set in ``plugin`` context variable. Metrics are exported as a
+Prometheus node-exporter textfile and as a JSON summary.
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+
+# name of the plugin the current code runs for
+plugin = contextvars.ContextVar("plugin", default=None)
+
+
+def _write_atomically(path, text):
+    # node-exporter may read the file at any time, never let it see half of it
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+
+
+class RunMetrics:
+    """Metrics of a single bulletin."""
+
+    def __init__(self):
+        self.timestamp = time.time()
+        self.phases = {}
+        self.plugins = {}
+        self.airtime = None
+        self._lock = threading.Lock()
+
+    def add_phase(self, name, seconds):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - started)
+
+    def _plugin_stats(self, name):
+        return self.plugins.setdefault(
+            name, {"status": "running", "fetch": 0.0, "parse": 0.0, "bytes": 0}
+        )
+
+    def record_download(self, size, seconds):
+        name = plugin.get()
+        if name is None:
+            return
+        with self._lock:
+            stats = self._plugin_stats(name)
+            stats["fetch"] += seconds
+            stats["bytes"] += size
+
+    def record_plugin(self, name, seconds, status):
+        """Records plugin's run time; everything which wasn't a download is
+        counted as parsing."""
+        with self._lock:
+            stats = self._plugin_stats(name)
+            if stats["status"] != "timeout":
+                stats["status"] = status
+            stats["parse"] = max(seconds - stats["fetch"], 0.0)
+
+    def set_status(self, name, status):
+        with self._lock:
+            self._plugin_stats(name)["status"] = status
+
+    def summary(self):
+        with self._lock:
+            return {
+                "timestamp": self.timestamp,
+                "phases": dict(self.phases),
+                "plugins": {name: dict(s) for name, s in self.plugins.items()},
+                "airtime": self.airtime,
+            }
+
+    def write_json(self, path):
+        _write_atomically(path, json.dumps(self.summary(), indent=2))
+
+    def write_textfile(self, path):
+        summary = self.summary()
+        lines = [
+            "# HELP sr0wx_last_run_timestamp_seconds Start time of the last run.",
+            "# TYPE sr0wx_last_run_timestamp_seconds gauge",
+            f"sr0wx_last_run_timestamp_seconds {summary['timestamp']:.3f}",
+            "# HELP sr0wx_phase_duration_seconds Wall time of run phases.",
+            "# TYPE sr0wx_phase_duration_seconds gauge",
+        ]
+        for name, seconds in summary["phases"].items():
+            lines.append(
+                f'sr0wx_phase_duration_seconds{{phase="{name}"}} {seconds:.6f}'
+            )
+
+        lines += [
+            "# HELP sr0wx_plugin_duration_seconds Plugin fetch and parse time.",
+            "# TYPE sr0wx_plugin_duration_seconds gauge",
+        ]
+        for name, stats in summary["plugins"].items():
+            for stage in ("fetch", "parse"):
+                lines.append(
+                    f'sr0wx_plugin_duration_seconds{{plugin="{name}",stage="{stage}"}}'
+                    f" {stats[stage]:.6f}"
+                )
+        lines += [
+            "# HELP sr0wx_plugin_downloaded_bytes Bytes downloaded by plugin.",
+            "# TYPE sr0wx_plugin_downloaded_bytes gauge",
+        ]
+        for name, stats in summary["plugins"].items():
+            lines.append(
+                f'sr0wx_plugin_downloaded_bytes{{plugin="{name}"}} {stats["bytes"]}'
+            )
+        lines += [
+            "# HELP sr0wx_plugin_success Whether plugin returned its data in time.",
+            "# TYPE sr0wx_plugin_success gauge",
+        ]
+        for name, stats in summary["plugins"].items():
+            success = int(stats["status"] == "ok")
+            lines.append(f'sr0wx_plugin_success{{plugin="{name}"}} {success}')
+
+        if summary["airtime"] is not None:
+            lines += [
+                "# HELP sr0wx_airtime_seconds Length of the last bulletin.",
+                "# TYPE sr0wx_airtime_seconds gauge",
+                f"sr0wx_airtime_seconds {summary['airtime']:.3f}",
+            ]
+        _write_atomically(path, "\n".join(lines) + "\n")
+
+
+current = RunMetrics()
+
+
+def new_run():
+    """Starts collecting metrics of a new run."""
+    global current
+    current = RunMetrics()
+    return current
+
+
+def record_download(size, seconds):
+    current.record_download(size, seconds)
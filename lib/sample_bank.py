@@ -0,0 +1,140 @@
+"""Packed sample bank.
+
+Every voice in ``assets/<language>/`` consists of ~1500 small Vorbis files.
+Instead of decoding them on every run, ``build()`` decodes all of them once
+(resampled to the playback sampling rate, in mono) into a single file of raw
+int16 PCM, with a JSON index holding offset and length (in frames) of every
+sample. At runtime
+``SampleBank`` opens the file with ``numpy.memmap``, so getting a sample is just
+a slice of the mapped file.
+"""
+
+import glob
+import json
+import logging
+import os
+
+import numpy
+
+from lib.sample_levels import levels_path
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".json"
+
+
+def bank_path(assets_base_path, language):
+    return os.path.join(assets_base_path, f"{language}.bank")
+
+
+def mono(pcm):
+    """Returns the first channel of ``pcm`` (samples are mono anyway)."""
+    if pcm.ndim == 1:
+        return pcm
+    return numpy.ascontiguousarray(pcm[:, 0])
+
+
+def decode_sample(path):
+    """Decodes a sample file into mono PCM at mixer's sampling rate."""
+    import pygame
+
+    return mono(pygame.sndarray.array(pygame.mixer.Sound(path)))
+
+
+def build(assets_base_path, language, levels=None):
+    """Decodes all samples of a ``language`` into a bank file.
+
+    ``pygame.mixer`` has to be initialized with the playback sampling rate, as
+    samples are stored resampled to it. Samples are stored already trimmed and
+    amplified according to ``levels`` (``lib.sample_levels.SampleLevels``).
+    """
+    import pygame
+
+    sampling_frequency = pygame.mixer.get_init()[0]
+    path = bank_path(assets_base_path, language)
+    samples = {}
+    offset = 0
+    with open(path + ".tmp", "wb") as f:
+        for sample_path in sorted(
+            glob.glob(os.path.join(assets_base_path, language, "*.ogg"))
+        ):
+            name = os.path.splitext(os.path.basename(sample_path))[0]
+            try:
+                pcm = decode_sample(sample_path)
+            except pygame.error:
+                logger.exception("Couldn't decode %s", sample_path)
+                continue
+            if levels is not None:
+                pcm = levels.apply(name, pcm, sampling_frequency)
+            f.write(numpy.ascontiguousarray(pcm, numpy.int16).tobytes())
+            samples[name] = (offset, len(pcm))
+            offset += len(pcm)
+
+    index = {
+        "sampling_frequency": sampling_frequency,
+        "channels": 1,
+        "samples": samples,
+    }
+    with open(path + INDEX_SUFFIX + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(path + ".tmp", path)
+    os.replace(path + INDEX_SUFFIX + ".tmp", path + INDEX_SUFFIX)
+
+    logger.info("Built %s: %i samples, %i frames", path, len(samples), offset)
+    return path
+
+
+class SampleBank:
+    """Read-only view of a bank file built with ``build()``."""
+
+    def __init__(self, path):
+        with open(path + INDEX_SUFFIX, encoding="utf-8") as f:
+            index = json.load(f)
+        self.sampling_frequency = index["sampling_frequency"]
+        self.channels = index["channels"]
+        self._samples = index["samples"]
+        if self._samples:
+            self._pcm = numpy.memmap(path, numpy.int16, "r")
+        else:
+            self._pcm = numpy.zeros(0, numpy.int16)
+
+    @classmethod
+    def open(cls, assets_base_path, language, sampling_frequency):
+        """Returns the bank for ``language``, or ``None`` if there is no usable
+        bank (missing, built for other sampling rate or in an old, multichannel
+        format)."""
+        path = bank_path(assets_base_path, language)
+        if not os.path.isfile(path + INDEX_SUFFIX):
+            return None
+
+        bank = cls(path)
+        if (bank.sampling_frequency, bank.channels) != (sampling_frequency, 1):
+            logger.warning(
+                "Sample bank %s was built for %iHz/%ich, rebuild it with --build-bank",
+                path,
+                bank.sampling_frequency,
+                bank.channels,
+            )
+            return None
+        if os.path.getmtime(os.path.join(assets_base_path, language)) > (
+            os.path.getmtime(path)
+        ):
+            logger.warning("Sample bank %s is older than its samples", path)
+        levels = levels_path(assets_base_path, language)
+        if os.path.isfile(levels) and os.path.getmtime(levels) > os.path.getmtime(path):
+            logger.warning("Sample bank %s is older than %s", path, levels)
+        return bank
+
+    def __contains__(self, name):
+        return name in self._samples
+
+    def __getitem__(self, name):
+        offset, length = self._samples[name]
+        return self._pcm[offset : offset + length]
+
+    def length(self, name):
+        """Returns length of sample ``name`` in frames."""
+        return self._samples[name][1]
+
+    def __len__(self):
+        return len(self._samples)
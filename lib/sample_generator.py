@@ -0,0 +1,263 @@
+"""Sample generation.
+
+Samples of a voice are described by a manifest (``audio_generator/manifest.toml``):
+a TTS backend with its parameters, encoding parameters and a dictionary of file
+names and texts. Every sample is synthesized by the backend and encoded with
+``ffmpeg`` into a Vorbis file in a content-addressed cache, keyed by a hash of
+its text, backend parameters and encoding. Only samples missing from the cache
+are synthesized, in a process pool; the others are just copied from the cache.
+Texts are read in lowercase, as the original PHP generator did. Files which
+already exist in the output directory, but weren't written by the generator
+(e.g. the samples in the repository), are kept as they are, unless they're
+asked for by name.
+
+Backends are classes with ``identity()``, which returns everything that affects
+the synthesized audio, and ``synthesize(text, path)``, which writes it to
+``path`` (in any format ``ffmpeg`` reads, with ``extension``). They're created
+from the ``[voice]`` table of the manifest, by its ``backend`` key.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRECTORY = os.path.join("cache", "samples")
+STATE_FILE = "state.json"
+# state of existing files which weren't generated: "existing:<cache key>"
+EXISTING = "existing:"
+
+
+class CommandBackend:
+    """Runs a local speech synthesizer. ``{text}`` and ``{output}`` in
+    ``command`` arguments are replaced with the text and the output path."""
+
+    def __init__(self, command, extension="wav"):
+        self.command = list(command)
+        self.extension = extension
+
+    def identity(self):
+        return {"backend": "command", "command": self.command}
+
+    def synthesize(self, text, path):
+        subprocess.run(
+            [arg.format(text=text, output=path) for arg in self.command],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+
+class ResponsiveVoiceBackend:
+    """Synthesizes speech with responsivevoice.org, like the original PHP
+    generator did."""
+
+    SITE_URL = "https://responsivevoice.org/"
+    API_URL = "https://texttospeech.responsivevoice.org/v1/text:synthesize"
+    extension = "mp3"
+
+    def __init__(
+        self, lang="pl", engine="g1", gender="female", pitch=0.5, rate=0.5, volume=1
+    ):
+        self.params = {
+            "lang": lang,
+            "engine": engine,
+            "name": "",
+            "pitch": pitch,
+            "rate": rate,
+            "volume": volume,
+            "gender": gender,
+        }
+        self.key = None
+
+    def identity(self):
+        return {"backend": "responsivevoice", **self.params}
+
+    def prepare(self):
+        """Reads the API key from the site's script tag, once for all samples."""
+        from lib import http_client
+
+        page = http_client.get(self.SITE_URL).decode("utf-8", "replace")
+        tag = re.search(r"<script[^>]*responsive-voice-js[^>]*>", page)
+        key = tag and re.search(r"[?&]key=([^&\"']+)", tag.group(0))
+        if not key:
+            raise RuntimeError("Couldn't find responsivevoice.org API key")
+        self.key = key.group(1)
+
+    def synthesize(self, text, path):
+        from lib import http_client
+
+        query = urllib.parse.urlencode({**self.params, "key": self.key, "text": text})
+        with open(path, "wb") as f:
+            f.write(http_client.get(f"{self.API_URL}?{query}"))
+
+
+BACKENDS = {
+    "command": CommandBackend,
+    "responsivevoice": ResponsiveVoiceBackend,
+}
+
+
+def create_backend(voice):
+    """Creates the backend described by ``[voice]`` table of a manifest."""
+    params = {k: v for k, v in voice.items() if k not in ("backend", "output")}
+    return BACKENDS[voice["backend"]](**params)
+
+
+def sample_key(text, backend, encoding):
+    """Returns the cache key of a sample."""
+    content = json.dumps(
+        {"text": text, "voice": backend.identity(), "encoding": encoding},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _encode(source, path, encoding):
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            source,
+            "-ar",
+            str(encoding["sampling_frequency"]),
+            "-ac",
+            "1",
+            "-b:a",
+            str(encoding["bitrate"]),
+            "-acodec",
+            "libvorbis",
+            "-f",
+            "ogg",
+            path,
+        ],
+        check=True,
+    )
+
+
+def _synthesize(backend, text, encoding, path):
+    # runs in a worker process
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, f"sample.{backend.extension}")
+        backend.synthesize(text, source)
+        _encode(source, path + ".tmp", encoding)
+    os.replace(path + ".tmp", path)
+
+
+def _read_state(cache_directory):
+    try:
+        with open(os.path.join(cache_directory, STATE_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(cache_directory, state):
+    path = os.path.join(cache_directory, STATE_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+
+def generate(manifest, names=None, jobs=None, cache_directory=CACHE_DIRECTORY):
+    """Generates samples of ``manifest`` (optionally only ``names``) into its
+    output directory, synthesizing in ``jobs`` processes. Returns the numbers of
+    synthesized samples, samples updated in the output directory and failed
+    ones."""
+    voice = manifest["voice"]
+    output = voice["output"]
+    encoding = manifest["encoding"]
+    backend = create_backend(voice)
+    samples = {name: text.strip().lower() for name, text in manifest["samples"].items()}
+    if names:
+        samples = {name: text for name, text in samples.items() if name in names}
+
+    os.makedirs(cache_directory, exist_ok=True)
+    os.makedirs(output, exist_ok=True)
+    # cache keys of samples in output directories, so up-to-date ones are skipped
+    state = _read_state(cache_directory)
+    written = state.setdefault(os.path.abspath(output), {})
+
+    keys = {name: sample_key(text, backend, encoding) for name, text in samples.items()}
+    if not names:
+        # existing files are taken as generated from the current manifest, so
+        # only samples whose text or voice changes later are replaced
+        adopted = [
+            name
+            for name in keys
+            if name not in written
+            and os.path.isfile(os.path.join(output, f"{name}.ogg"))
+        ]
+        for name in adopted:
+            written[name] = EXISTING + keys[name]
+        if adopted:
+            logger.info("Keeping %i existing samples of %s", len(adopted), output)
+
+    current = {
+        name
+        for name, key in keys.items()
+        # existing files are replaced when they're asked for by name
+        if (
+            written.get(name) == key
+            or (written.get(name) == EXISTING + key and not names)
+        )
+        and os.path.isfile(os.path.join(output, f"{name}.ogg"))
+    }
+    missing = {
+        name: key
+        for name, key in keys.items()
+        if name not in current
+        and not os.path.isfile(os.path.join(cache_directory, f"{key}.ogg"))
+    }
+    failed = set()
+    if missing:
+        logger.info("Synthesizing %i samples", len(missing))
+        if hasattr(backend, "prepare"):
+            backend.prepare()
+        # workers mustn't inherit connections of the parent's HTTP session
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(jobs, context) as executor:
+            futures = {
+                executor.submit(
+                    _synthesize,
+                    backend,
+                    samples[name],
+                    encoding,
+                    os.path.join(cache_directory, f"{key}.ogg"),
+                ): name
+                for name, key in missing.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Couldn't generate %s: %s", name, e)
+                    failed.add(name)
+                else:
+                    logger.info("%s - %s", samples[name], name)
+
+    updated = 0
+    for name, key in keys.items():
+        path = os.path.join(output, f"{name}.ogg")
+        if name in failed or name in current:
+            continue
+        shutil.copyfile(os.path.join(cache_directory, f"{key}.ogg"), path + ".tmp")
+        os.replace(path + ".tmp", path)
+        written[name] = key
+        updated += 1
+    _write_state(cache_directory, state)
+
+    return len(missing) - len(failed), updated, len(failed)
@@ -0,0 +1,162 @@
+"""Silence trimming and loudness normalisation of samples.
+
+Most generated samples start and end with silence of varying length and their
+levels differ. ``analyse()`` goes through all samples of a language once and
+writes ``assets/<language>.levels.json`` with, for every sample, the start and
+end of its sound (in seconds, without leading and trailing silence) and the gain
+which brings its loudness (RMS of the sound) to the common level. ``SampleLevels``
+applies them when samples are loaded or built into the sample bank, so nothing
+is analysed at runtime.
+"""
+
+import glob
+import json
+import logging
+import os
+
+import numpy
+
+logger = logging.getLogger(__name__)
+
+LEVELS_SUFFIX = ".levels.json"
+
+# loudness is measured in windows of this length, in milliseconds
+WINDOW = 10
+# windows quieter than this (in dB below the loudest window) are silence...
+SILENCE_THRESHOLD = -40
+# ...and so are windows below this absolute level (dBFS), e.g. in silent files
+NOISE_FLOOR = -60
+# silence kept before and after the sound, in milliseconds
+MARGIN = 20
+# gain never pushes peaks above this level (dBFS)
+MAX_PEAK = -1
+
+
+def levels_path(assets_base_path, language):
+    return os.path.join(assets_base_path, f"{language}{LEVELS_SUFFIX}")
+
+
+def _dbfs(db):
+    return 32767 * 10 ** (db / 20)
+
+
+def measure(pcm, sampling_frequency):
+    """Returns ``(start, end, loudness, peak)`` of the sound in mono ``pcm``:
+    start and end in frames, RMS of the sound and its peak; or ``None`` if it's
+    all silence."""
+    window = max(sampling_frequency * WINDOW // 1000, 1)
+    windows = len(pcm) // window
+    if windows == 0:
+        return None
+    x = pcm[: windows * window].astype(numpy.float64).reshape(windows, window)
+    rms = numpy.sqrt((x * x).mean(axis=1))
+    threshold = max(rms.max() * 10 ** (SILENCE_THRESHOLD / 20), _dbfs(NOISE_FLOOR))
+    loud = numpy.flatnonzero(rms > threshold)
+    if len(loud) == 0:
+        return None
+
+    margin = sampling_frequency * MARGIN // 1000
+    start = max(loud[0] * window - margin, 0)
+    end = min((loud[-1] + 1) * window + margin, len(pcm))
+    voiced = rms[loud[0] : loud[-1] + 1]
+    loudness = float(numpy.sqrt((voiced * voiced).mean()))
+    peak = int(numpy.abs(pcm[start:end].astype(numpy.int32)).max())
+    return start, end, loudness, peak
+
+
+def analyse(assets_base_path, language, target=None):
+    """Measures all samples of a ``language`` and writes their trim points and
+    gains. Loudness is normalised to ``target`` (dBFS) or, by default, to the
+    median loudness of all samples.
+
+    ``pygame.mixer`` has to be initialized, samples are decoded with it.
+    """
+    import pygame
+
+    from lib.sample_bank import decode_sample
+
+    sampling_frequency = pygame.mixer.get_init()[0]
+    measured = {}
+    for sample_path in sorted(
+        glob.glob(os.path.join(assets_base_path, language, "*.ogg"))
+    ):
+        name = os.path.splitext(os.path.basename(sample_path))[0]
+        try:
+            pcm = decode_sample(sample_path)
+        except pygame.error:
+            logger.exception("Couldn't decode %s", sample_path)
+            continue
+        result = measure(pcm, sampling_frequency)
+        if result is None:
+            logger.warning("%s is silent", sample_path)
+            continue
+        measured[name] = (len(pcm), *result)
+
+    if target is None:
+        level = float(numpy.median([m[3] for m in measured.values()] or [0.0]))
+    else:
+        level = _dbfs(target)
+    max_peak = _dbfs(MAX_PEAK)
+
+    samples = {}
+    trimmed = 0
+    for name, (frames, start, end, loudness, peak) in measured.items():
+        gain = min(level / loudness, max_peak / peak)
+        samples[name] = [
+            round(start / sampling_frequency, 4),
+            round(end / sampling_frequency, 4),
+            round(gain, 3),
+        ]
+        trimmed += frames - (end - start)
+
+    path = levels_path(assets_base_path, language)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"level": round(level, 1), "samples": samples}, f)
+    os.replace(path + ".tmp", path)
+
+    logger.info(
+        "Analysed %i samples into %s, %.1fs of silence trimmed",
+        len(samples),
+        path,
+        trimmed / sampling_frequency,
+    )
+    return path
+
+
+class SampleLevels:
+    """Trim points and gains of samples, written by ``analyse()``."""
+
+    def __init__(self, samples=None):
+        self._samples = samples or {}
+
+    @classmethod
+    def open(cls, assets_base_path, language):
+        """Returns levels of ``language`` samples; no sample is changed if they
+        haven't been analysed."""
+        path = levels_path(assets_base_path, language)
+        if not os.path.isfile(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["samples"])
+
+    def __bool__(self):
+        return bool(self._samples)
+
+    def duration(self, name):
+        """Returns length of trimmed sample ``name`` in seconds, or ``None`` if
+        it isn't trimmed."""
+        if name not in self._samples:
+            return None
+        start, end, _ = self._samples[name]
+        return end - start
+
+    def apply(self, name, pcm, sampling_frequency):
+        """Trims and amplifies mono ``pcm`` of sample ``name``."""
+        if name not in self._samples:
+            return pcm
+        start, end, gain = self._samples[name]
+        pcm = pcm[round(start * sampling_frequency) : round(end * sampling_frequency)]
+        if gain != 1.0:
+            pcm = numpy.clip(pcm * numpy.float32(gain), -32768, 32767)
+            pcm = pcm.astype(numpy.int16)
+        return pcm
@@ -0,0 +1,92 @@
+"""Bulletin scheduler for daemon mode.
+
+Transmission slots are given in crontab format (``minute hour day-of-month month
+day-of-week``), with ``*``, ``a-b``, ``a,b`` and ``/step`` supported in every field.
+"""
+
+import datetime
+
+# (lowest, highest) allowed value of each crontab field
+FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_field(field, low, high):
+    values = set()
+    for part in field.split(","):
+        span, _, step = part.partition("/")
+        if span == "*":
+            start, end = low, high
+        elif "-" in span:
+            start, end = (int(v) for v in span.split("-", 1))
+        else:
+            start = int(span)
+            # "5/15" means "from 5 every 15"
+            end = high if step else start
+        step = int(step) if step else 1
+        if not low <= start <= end <= high or step < 1:
+            raise ValueError(f"Invalid crontab field: {field}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSlot:
+    """Single crontab-like schedule entry."""
+
+    def __init__(self, spec):
+        fields = spec.split()
+        if len(fields) != len(FIELDS):
+            raise ValueError(f"Crontab entry needs {len(FIELDS)} fields: {spec}")
+        self.spec = spec
+        parsed = [_parse_field(f, *limits) for f, limits in zip(fields, FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # both 0 and 7 mean Sunday
+        self.weekdays = frozenset(d % 7 for d in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, dt):
+        day = dt.day in self.days
+        weekday = (dt.weekday() + 1) % 7 in self.weekdays
+        # like in cron: if both are restricted, either of them has to match
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_run(self, after):
+        """Returns the first matching minute later than ``after``."""
+        dt = after.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        limit = dt + datetime.timedelta(days=366 * 5)
+        while dt < limit:
+            if dt.month not in self.months:
+                month = dt.month % 12 + 1
+                dt = dt.replace(
+                    year=dt.year + (month == 1), month=month, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+            elif dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + datetime.timedelta(hours=1)
+            elif dt.minute not in self.minutes:
+                dt += datetime.timedelta(minutes=1)
+            else:
+                return dt
+        raise ValueError(f"Crontab entry never matches: {self.spec}")
+
+    def __repr__(self):
+        return f"CronSlot({self.spec!r})"
+
+
+class Scheduler:
+    """Set of transmission slots."""
+
+    def __init__(self, slots):
+        self.slots = [CronSlot(spec) for spec in slots]
+
+    @classmethod
+    def from_hour_quarter(cls, hour_quarter):
+        """Transmits every 15 minutes, ``hour_quarter`` minutes after each full
+        quarter (same as ``activity_map``'s ``hour_quarter``)."""
+        return cls([f"{int(hour_quarter) % 15}/15 * * * *"])
+
+    def next_run(self, after):
+        return min(slot.next_run(after) for slot in self.slots)
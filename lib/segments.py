@@ -0,0 +1,177 @@
+"""Typed bulletin messages.
+
+Plugins return their messages as flat lists of sample names, ``"_"`` pauses,
+``file://`` paths, ``cw://`` texts (sent in Morse code) and PCM arrays. Core
+converts them once into a ``Message``: a sequence of segments of explicit kinds,
+stored as two compact arrays (kind and value of every segment). Sample names,
+file paths and CW texts are interned into integer ids, so loading, deduplication
+and rendering work on integers instead of re-inspecting strings and types.
+"""
+
+import logging
+import threading
+from array import array
+
+import numpy
+
+logger = logging.getLogger(__name__)
+
+# segment kinds; value of the segment is:
+SAMPLE = 0  # id of the sample name
+SILENCE = 1  # length in milliseconds
+PCM = 2  # index of the array in Message.pcm
+FILE = 3  # id of the "file://" path
+CW = 4  # id of the "cw://" text
+
+_ids = {}
+_names = []
+_lock = threading.Lock()
+
+
+def intern(name):
+    """Returns the id of sample ``name``, the same for the whole process."""
+    with _lock:
+        sample_id = _ids.get(name)
+        if sample_id is None:
+            sample_id = _ids[name] = len(_names)
+            _names.append(name)
+        return sample_id
+
+
+def name(sample_id):
+    """Returns the sample name (or ``file://`` path, ``cw://`` text) of
+    ``sample_id``."""
+    return _names[sample_id]
+
+
+class Message:
+    """Sequence of bulletin segments."""
+
+    def __init__(self):
+        self.kinds = array("b")
+        self.values = array("i")
+        self.pcm = []
+
+    @classmethod
+    def from_list(cls, elements, pause_length):
+        """Converts a plugin's message; ``"_"`` becomes ``pause_length`` ms of
+        silence."""
+        message = cls()
+        for el in elements:
+            if isinstance(el, str):
+                if el == "_":
+                    message.append_silence(pause_length)
+                elif el.startswith("file://"):
+                    message.append_file(el.removeprefix("file://"))
+                elif el.startswith("cw://"):
+                    message.append_cw(el.removeprefix("cw://"))
+                else:
+                    message.append_sample(el)
+            elif isinstance(el, numpy.ndarray):
+                message.append_pcm(el)
+            else:
+                logger.error("Unsupported sample type: %s (sample %s)", type(el), el)
+        return message
+
+    def _append(self, kind, value):
+        self.kinds.append(kind)
+        self.values.append(value)
+
+    def append_sample(self, sample_name):
+        self._append(SAMPLE, intern(sample_name))
+
+    def append_file(self, path):
+        self._append(FILE, intern("file://" + path))
+
+    def append_cw(self, text):
+        self._append(CW, intern("cw://" + text))
+
+    def append_silence(self, milliseconds):
+        # consecutive pauses are merged into one segment
+        if self.kinds and self.kinds[-1] == SILENCE:
+            self.values[-1] += milliseconds
+        else:
+            self._append(SILENCE, milliseconds)
+
+    def append_pcm(self, pcm):
+        self._append(PCM, len(self.pcm))
+        self.pcm.append(pcm)
+
+    def extend(self, other):
+        for kind, value in other:
+            if kind == SILENCE:
+                self.append_silence(value)
+            elif kind == PCM:
+                self.append_pcm(other.pcm[value])
+            else:
+                self._append(kind, value)
+
+    def _segment_frames(self, kind, value, sample_frames, sampling_frequency):
+        if kind == SILENCE:
+            return sampling_frequency * value // 1000
+        if kind == PCM:
+            return len(self.pcm[value])
+        return sample_frames(value)
+
+    def frames(self, sample_frames, sampling_frequency):
+        """Returns length of the message in frames at ``sampling_frequency``;
+        ``sample_frames(sample_id)`` has to return lengths of samples."""
+        return sum(
+            self._segment_frames(kind, value, sample_frames, sampling_frequency)
+            for kind, value in self
+        )
+
+    def truncated(self, max_frames, sample_frames, sampling_frequency):
+        """Returns the longest part of the message which ends at a pause (or is
+        the whole message) and is at most ``max_frames`` long."""
+        total = 0
+        end = 0
+        for index, (kind, value) in enumerate(self):
+            if kind == SILENCE and total <= max_frames:
+                end = index
+            total += self._segment_frames(
+                kind, value, sample_frames, sampling_frequency
+            )
+        if total <= max_frames:
+            end = len(self)
+
+        message = Message()
+        for kind, value in zip(self.kinds[:end], self.values[:end]):
+            if kind == PCM:
+                message.append_pcm(self.pcm[value])
+            else:
+                message._append(kind, value)
+        return message
+
+    def sample_ids(self):
+        """Returns ids of distinct samples, files and CW texts used in the
+        message."""
+        return {
+            value
+            for kind, value in zip(self.kinds, self.values)
+            if kind in (SAMPLE, FILE, CW)
+        }
+
+    def playlist(self):
+        """Returns the message as text, for logging."""
+        words = []
+        for kind, value in self:
+            if kind == SILENCE:
+                words.append("_")
+            elif kind == PCM:
+                words.append("[sndarray]")
+            else:
+                words.append(name(value))
+        return " ".join(words)
+
+    def __iter__(self):
+        return zip(self.kinds, self.values)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __add__(self, other):
+        message = Message()
+        message.extend(self)
+        message.extend(other)
+        return message
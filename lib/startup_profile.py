@@ -0,0 +1,39 @@
+"""Startup profile.
+
+``python -X importtime`` writes a line to stderr for every imported module, with
+its own and cumulative import time in microseconds. ``parse()`` reads these
+lines, ``report()`` shows which imports make startup slow.
+"""
+
+import re
+
+IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\| ( *)(\S+)\s*$", re.MULTILINE
+)
+
+
+def parse(stderr):
+    """Returns ``(module, self time, cumulative time, depth)`` tuples (times in
+    seconds) of every import listed in ``stderr``."""
+    return [
+        (module, int(own) / 1e6, int(cumulative) / 1e6, len(indent) // 2)
+        for own, cumulative, indent, module in IMPORTTIME_LINE.findall(stderr)
+    ]
+
+
+def report(imports, top=20):
+    """Returns the report as text: total import time, the slowest top-level
+    imports (with everything they import) and the slowest modules by their own
+    import time."""
+    top_level = [entry for entry in imports if entry[3] == 0]
+    total = sum(cumulative for _, _, cumulative, _ in top_level)
+    lines = [f"{len(imports)} modules imported in {total:.3f}s", ""]
+
+    lines.append("slowest imports (cumulative):")
+    for module, _, cumulative, _ in sorted(top_level, key=lambda e: -e[2])[:top]:
+        lines.append(f"  {cumulative:8.3f}s  {module}")
+
+    lines += ["", "slowest modules (self):"]
+    for module, own, _, _ in sorted(imports, key=lambda e: -e[1])[:top]:
+        lines.append(f"  {own:8.3f}s  {module}")
+    return "\n".join(lines)
@@ -0,0 +1,119 @@
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+from lib import airtime, segments
+from lib.sample_bank import decode_sample
+from lib.segments import Message
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "assets", "pl_google")
+
+LENGTHS = {"a": 300, "b": 500, "c": 200}
+
+
+class Durations:
+    """Sample lengths at 1 frame per millisecond"""
+
+    sampling_frequency = 1000
+
+    def __call__(self, sample_id):
+        return LENGTHS[segments.name(sample_id)]
+
+
+class TestPlan(unittest.TestCase):
+    """Tests of fitting plugins' messages in the airtime"""
+
+    def setUp(self):
+        self.durations = Durations()
+        # (name, priority, message); 900 + 500 + 700 = 2100 frames
+        self.parts = [
+            ("intro", 10, Message.from_list(["a", "_", "b"], 100)),
+            ("weather", 5, Message.from_list(["b"], 100)),
+            ("extra", 1, Message.from_list(["a", "_", "c", "_"], 100)),
+        ]
+
+    def plan(self, budget):
+        with self.assertLogs("lib.airtime", "WARNING") as logs:
+            messages = airtime.plan(self.parts, budget, self.durations)
+        return [m.playlist().split() for m in messages], logs.output
+
+    def test_fits(self):
+        """Messages which fit are left as they are"""
+        messages = airtime.plan(self.parts, 2100, self.durations)
+        self.assertEqual(
+            [m.playlist().split() for m in messages],
+            [["a", "_", "b"], ["b"], ["a", "_", "c", "_"]],
+        )
+
+    def test_trim(self):
+        """The least important message is trimmed at a pause"""
+        messages, logs = self.plan(1700)
+        self.assertEqual(messages, [["a", "_", "b"], ["b"], ["a"]])
+        self.assertIn("Trimmed extra", logs[0])
+
+    def test_drop(self):
+        """A message of which nothing fits is dropped, then the next one is
+        trimmed"""
+        messages, logs = self.plan(1000)
+        self.assertEqual(messages, [["a", "_", "b"], [], []])
+        self.assertEqual(len(logs), 2)
+        self.assertIn("Dropped extra", logs[0])
+        self.assertIn("Dropped weather", logs[1])
+
+    def test_trim_after_drop(self):
+        """Less important messages are dropped before a more important one is
+        trimmed"""
+        messages, logs = self.plan(500)
+        self.assertEqual(messages, [["a"], [], []])
+        self.assertIn("Trimmed intro", logs[2])
+
+    def test_negative_budget(self):
+        """With a negative budget everything is dropped"""
+        messages, logs = self.plan(-100)
+        self.assertEqual(messages, [[], [], []])
+        self.assertIn("Dropped intro", logs[2])
+        self.assertIn("too long even without", logs[3])
+
+
+class TestSampleLengths(unittest.TestCase):
+    """Tests of sample lengths against decoded samples"""
+
+    # a 32kHz sample which gets 512 frames shorter when resampled to 16kHz than
+    # its Ogg length says
+    SAMPLE = os.path.join(SAMPLES, "jedna.ogg")
+
+    def init_mixer(self, sampling_frequency):
+        with mock.patch.dict(os.environ, {"SDL_AUDIODRIVER": "dummy"}):
+            pygame.mixer.init(sampling_frequency, -16, 1, 1024)
+        self.addCleanup(pygame.mixer.quit)
+
+    def durations(self, **kwargs):
+        return airtime.SampleDurations(
+            pygame.mixer.get_init()[0],
+            lambda name: os.path.join(SAMPLES, f"{name}.ogg"),
+            **kwargs,
+        )
+
+    def test_ogg_length(self):
+        """Ogg length is the decoded length at the sample's own rate"""
+        frames, sampling_frequency = airtime.ogg_frames(self.SAMPLE)
+        self.init_mixer(sampling_frequency)
+        self.assertEqual(frames, len(decode_sample(self.SAMPLE)))
+        self.assertEqual(self.durations()(segments.intern("jedna")), frames)
+
+    def test_resampled_length(self):
+        """Samples at another rate are measured decoded"""
+        self.init_mixer(16000)
+        sound_samples = {}
+        durations = self.durations(decode=decode_sample, sound_samples=sound_samples)
+        sample_id = segments.intern("jedna")
+        decoded = len(decode_sample(self.SAMPLE))
+        self.assertEqual(durations(sample_id), decoded)
+        # kept for playback
+        self.assertEqual(len(sound_samples[sample_id]), decoded)
+
+
+if __name__ == "__main__":
+    unittest.main()
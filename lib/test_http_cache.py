@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from lib import http_cache
+
+URL = "http://example.com/data.json"
+
+
+class Response:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class TestHttpCache(unittest.TestCase):
+    """Tests of the on-disk HTTP response cache"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        http_cache.configure(self.directory, 1024 * 1024, 3)
+        self.addCleanup(setattr, http_cache, "_directory", None)
+        self.now = 1000000.0
+        patcher = mock.patch("lib.http_cache.time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.responses = []
+        self.requests = []
+        patcher = mock.patch("lib.http_client.request", self.request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def fill(self):
+        self.responses.append(Response(200, b"data", {"ETag": '"v1"'}))
+        self.assertEqual(http_cache.get(URL, 60), b"data")
+
+    def test_hit(self):
+        """Fresh entries are returned without a request"""
+        self.fill()
+        self.now += 59
+        self.assertEqual(http_cache.get(URL, 60), b"data")
+        self.assertEqual(len(self.requests), 1)
+
+    def test_not_modified(self):
+        """Stale entries are revalidated; 304 keeps the body and refreshes it"""
+        self.fill()
+        self.now += 61
+        self.responses.append(Response(304))
+        self.assertEqual(http_cache.get(URL, 60), b"data")
+        self.assertEqual(self.requests[1]["If-None-Match"], '"v1"')
+        self.now += 59
+        self.assertEqual(http_cache.get(URL, 60), b"data")
+        self.assertEqual(len(self.requests), 2)
+
+    def test_modified(self):
+        """Changed data replaces the cached copy"""
+        self.fill()
+        self.now += 61
+        self.responses.append(Response(200, b"new"))
+        self.assertEqual(http_cache.get(URL, 60), b"new")
+        self.assertEqual(http_cache.get(URL, 60), b"new")
+
+    def test_stale_on_error(self):
+        """Stale copy is used if the source can't be reached, for a while"""
+        self.fill()
+        self.now += 179
+        self.responses.append(requests.ConnectionError("down"))
+        with self.assertLogs("lib.http_cache", "WARNING"):
+            self.assertEqual(http_cache.get(URL, 60), b"data")
+
+    def test_too_stale(self):
+        """Errors are raised once the cached copy is too old"""
+        self.fill()
+        self.now += 180
+        self.responses.append(requests.ConnectionError("down"))
+        with self.assertLogs("lib.http_cache", "WARNING"):
+            with self.assertRaises(requests.ConnectionError):
+                http_cache.get(URL, 60)
+        self.responses.append(Response(503))
+        with self.assertLogs("lib.http_cache", "WARNING"):
+            self.assertEqual(http_cache.get(URL, 60, max_stale=3600), b"data")
+
+    def test_error_without_copy(self):
+        """Errors are raised if nothing is cached"""
+        self.responses.append(Response(404))
+        with self.assertRaises(requests.HTTPError):
+            http_cache.get(URL, 60)
+
+    def test_evict(self):
+        """Least recently used entries are evicted over the size limit"""
+        http_cache.configure(self.directory, 2500)
+        for i in range(3):
+            url = f"{URL}?{i}"
+            self.responses.append(Response(200, bytes(1000)))
+            http_cache.get(url, 60)
+            path = http_cache._entry_path(url) + ".body"
+            # entry 1 is the least recently used one
+            os.utime(path, (i, {0: 200, 1: 100, 2: 300}[i]))
+        http_cache._evict()
+        cached = [
+            os.path.exists(http_cache._entry_path(f"{URL}?{i}") + ".body")
+            for i in range(3)
+        ]
+        self.assertEqual(cached, [True, False, True])
+        self.assertFalse(os.path.exists(http_cache._entry_path(f"{URL}?1") + ".json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import datetime
+import unittest
+
+from lib.scheduler import CronSlot, Scheduler
+
+# a Monday
+MONDAY = datetime.datetime(2024, 1, 1, 10, 7, 30)
+
+
+class TestCronSlot(unittest.TestCase):
+    """Tests of crontab-like schedule entries"""
+
+    def runs(self, spec, after, count):
+        slot = CronSlot(spec)
+        result = []
+        for _ in range(count):
+            after = slot.next_run(after)
+            result.append(after)
+        return result
+
+    def test_every_15_minutes(self):
+        """*/15 runs at full quarters"""
+        self.assertEqual(
+            [dt.minute for dt in self.runs("*/15 * * * *", MONDAY, 5)],
+            [15, 30, 45, 0, 15],
+        )
+
+    def test_from_5_every_15(self):
+        """5/15 runs 5 minutes after full quarters"""
+        self.assertEqual(
+            [dt.minute for dt in self.runs("5/15 * * * *", MONDAY, 5)],
+            [20, 35, 50, 5, 20],
+        )
+        self.assertEqual(
+            Scheduler.from_hour_quarter(5).next_run(MONDAY),
+            MONDAY.replace(minute=20, second=0),
+        )
+
+    def test_range(self):
+        """1-5 in day-of-week field runs from Monday to Friday"""
+        runs = self.runs("0 12 * * 1-5", MONDAY, 6)
+        self.assertEqual([dt.weekday() for dt in runs], [0, 1, 2, 3, 4, 0])
+        self.assertTrue(all(dt.hour == 12 and dt.minute == 0 for dt in runs))
+
+    def test_next_minute(self):
+        """Next run is later than the given time, even if it matches"""
+        after = MONDAY.replace(minute=15, second=0)
+        self.assertEqual(
+            CronSlot("*/15 * * * *").next_run(after), after.replace(minute=30)
+        )
+
+    def test_day_of_month_or_day_of_week(self):
+        """If both days of month and of week are given, either has to match"""
+        runs = self.runs("0 0 13 * 5", MONDAY, 4)
+        # Fridays of January 2024 and the 13th (a Saturday)
+        self.assertEqual([dt.day for dt in runs], [5, 12, 13, 19])
+
+    def test_day_of_month_only(self):
+        """If only the day of month is given, day of week doesn't matter"""
+        runs = self.runs("0 0 13 * *", MONDAY, 2)
+        self.assertEqual([(dt.month, dt.day) for dt in runs], [(1, 13), (2, 13)])
+
+    def test_sunday(self):
+        """Both 0 and 7 mean Sunday"""
+        for spec in ("0 0 * * 0", "0 0 * * 7"):
+            self.assertEqual(CronSlot(spec).next_run(MONDAY).day, 7)
+
+    def test_invalid(self):
+        """Invalid entries are rejected"""
+        for spec in ("* * * *", "60 * * * *", "5-1 * * * *", "*/0 * * * *"):
+            with self.assertRaises(ValueError):
+                CronSlot(spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
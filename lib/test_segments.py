@@ -0,0 +1,59 @@
+import unittest
+
+import numpy
+
+from lib import segments
+from lib.segments import Message
+
+# 1 frame per millisecond, so pauses are as many frames long as milliseconds
+RATE = 1000
+LENGTHS = {"a": 300, "b": 500, "c": 200}
+
+
+def sample_frames(sample_id):
+    return LENGTHS[segments.name(sample_id)]
+
+
+class TestTruncated(unittest.TestCase):
+    """Tests of cutting messages at pauses"""
+
+    def setUp(self):
+        # a(300) _(100) b(500) _(100) c(200) = 1200 frames
+        self.message = Message.from_list(["a", "_", "b", "_", "c"], 100)
+
+    def playlist(self, message):
+        return message.playlist().split()
+
+    def test_whole_message_fits(self):
+        """A message which fits is kept whole"""
+        truncated = self.message.truncated(1200, sample_frames, RATE)
+        self.assertEqual(self.playlist(truncated), ["a", "_", "b", "_", "c"])
+
+    def test_cut_at_last_fitting_pause(self):
+        """Message is cut before the last pause which starts in the limit"""
+        truncated = self.message.truncated(1000, sample_frames, RATE)
+        self.assertEqual(self.playlist(truncated), ["a", "_", "b"])
+        self.assertEqual(truncated.frames(sample_frames, RATE), 900)
+
+    def test_nothing_fits(self):
+        """If no part ending at a pause fits, nothing is left"""
+        truncated = self.message.truncated(200, sample_frames, RATE)
+        self.assertEqual(len(truncated), 0)
+
+    def test_negative_limit(self):
+        """Negative limit leaves nothing"""
+        truncated = self.message.truncated(-100, sample_frames, RATE)
+        self.assertEqual(len(truncated), 0)
+
+    def test_pcm_is_kept(self):
+        """PCM segments are copied into the truncated message"""
+        pcm = numpy.zeros(400, numpy.int16)
+        message = Message.from_list([pcm, "_", "c"], 100)
+        truncated = message.truncated(450, sample_frames, RATE)
+        self.assertEqual(len(truncated.pcm), 1)
+        self.assertIs(truncated.pcm[0], pcm)
+        self.assertEqual(truncated.frames(sample_frames, RATE), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,23 @@
-# ruff: noqa: F401
-from . import (
-    airly,
-    air_pollution,
-    activity_map,
-    calendar,
-    geo_magnetic,
-    imgw_podest,
-    openweather,
-    propagation,
-    radioactive,
-    vhf_tropo,
-)
+"""Plugin registry.
+
+Plugins are found by their module names, without importing them, so only
+enabled plugins (and their dependencies, like PIL or msgspec) are imported.
+"""
+
+import importlib
+import pkgutil
+
+
+def available():
+    """Returns names of all plugins."""
+    return sorted(
+        module.name for module in pkgutil.iter_modules(__path__) if not module.ispkg
+    )
+
+
+def load(name):
+    """Imports and returns plugin ``name``. Raises ``KeyError`` if there's no
+    such plugin."""
+    if name not in available():
+        raise KeyError(name)
+    return importlib.import_module(f"{__name__}.{name}")
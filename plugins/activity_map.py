@@ -19,11 +19,10 @@
 import base64
 import json
 import logging
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
 
+import requests
+
+from lib import http_client
 from sr0wx_module import SR0WXModule
 
 
@@ -93,9 +92,7 @@ class ActivityMap(SR0WXModule):
         self.__logger.info("::: Odpytuję adres: " + url)
 
         try:
-            request = urllib.request.Request(url)
-            webFile = urllib.request.urlopen(request, None, 5)
-            response = webFile.read()
+            response = http_client.get(url, timeout=5)
 
             if response == b"OK":
                 self.__logger.info("::: Dane wysłano, status OK\n")
@@ -104,10 +101,10 @@ class ActivityMap(SR0WXModule):
                 self.__logger.error(log, url, response)
             return dict()
 
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
 
 
 def create(config):
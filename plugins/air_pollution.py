@@ -3,11 +3,12 @@
 
 import json
 import logging
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
+import os
+import time
 
+import requests
+
+from lib import http_cache, http_client
 from sr0wx_module import SR0WXModule
 
 
@@ -18,10 +19,26 @@ from sr0wx_module import SR0WXModule
 class AirPollutionSq9atk(SR0WXModule):
     """Klasa pobierająca info o zanieczyszczeniach powietrza"""
 
-    def __init__(self, language, service_url, city_id=1, station_id=3, **kwargs):
+    # cache lifetime, in seconds
+    STATIONS_TTL = 24 * 60 * 60
+    DATA_TTL = 10 * 60
+    # number of sensors downloaded at once
+    MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        language,
+        service_url,
+        city_id=1,
+        station_id=3,
+        catalog_path=os.path.join("cache", "air_pollution_catalog.json"),
+        **kwargs,
+    ):
         self.__language = language
         self.__service_url = service_url
         self.__station_id = station_id
+        self.__catalog_path = catalog_path
+        self.__catalog_entry = None
         self.__logger = logging.getLogger(__name__)
 
         self.__stations_url = "station/findAll/"
@@ -29,26 +46,81 @@ class AirPollutionSq9atk(SR0WXModule):
         self.__sensor_url = "data/getData/"
         self.__index_url = "aqindex/getIndex/"
 
-    def getJson(self, url):
+    def getJson(self, url, ttl=DATA_TTL):
         self.__logger.info("::: Odpytuję adres: " + url)
 
         try:
-            data = urllib.request.urlopen(url, None, 45)
-            return json.load(data)
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return json.loads(http_cache.get(url, ttl))
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
 
         return {}
 
-    def getStationName(self):
+    def readCatalog(self):
+        try:
+            with open(self.__catalog_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def writeCatalog(self, catalog):
+        os.makedirs(os.path.dirname(self.__catalog_path) or ".", exist_ok=True)
+        with open(self.__catalog_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(catalog, f)
+        os.replace(self.__catalog_path + ".tmp", self.__catalog_path)
+
+    def getCatalogEntry(self):
+        """Returns name and sensors of the station.
+
+        They're kept in a catalog file (indexed by station id) and refreshed
+        daily, so the national station list isn't downloaded and searched on
+        every run.
+        """
+        entry = self.__catalog_entry
+        if entry is None or time.time() - entry["fetched"] >= self.STATIONS_TTL:
+            entry = self.readCatalog().get(str(self.__station_id))
+        if entry is not None and time.time() - entry["fetched"] < self.STATIONS_TTL:
+            self.__catalog_entry = entry
+            return entry
+
+        self.__logger.info("::: Odświeżam katalog stacji...")
+        url = self.__service_url + self.__station_url + str(self.__station_id)
+        sensors = [
+            {"id": row["id"], "paramName": row["param"]["paramName"]}
+            for row in self.getJson(url, self.STATIONS_TTL)
+        ]
+        if not sensors:
+            # keep using the outdated entry rather than nothing
+            if entry is None:
+                raise RuntimeError("brak listy czujników")
+            return entry
+
         url = self.__service_url + self.__stations_url
-        stationName = ""
-        for station in self.getJson(url):
+        stationName = None
+        for station in self.getJson(url, self.STATIONS_TTL):
             if station["id"] == self.__station_id:
                 stationName = station["stationName"]
-        return stationName
+        if not stationName:
+            if entry is None or not entry["name"]:
+                # not saved, so the station list is asked again next time
+                self.__logger.error("::: Nie znaleziono nazwy stacji")
+                return {"fetched": time.time(), "name": "", "sensors": sensors}
+            stationName = entry["name"]
+
+        entry = {"fetched": time.time(), "name": stationName, "sensors": sensors}
+        catalog = self.readCatalog()
+        catalog[str(self.__station_id)] = entry
+        try:
+            self.writeCatalog(catalog)
+        except OSError:
+            self.__logger.exception("Couldn't save station catalog")
+        self.__catalog_entry = entry
+        return entry
+
+    def getStationName(self):
+        return self.getCatalogEntry()["name"]
 
     def getSensorValue(self, sensorId):
         url = self.__service_url + self.__sensor_url + str(sensorId)
@@ -64,12 +136,23 @@ class AirPollutionSq9atk(SR0WXModule):
         return self.getJson(url)
 
     def getSensorsData(self):
-        url = self.__service_url + self.__station_url + str(self.__station_id)
-        levelIndexArray = self.getLevelIndexData()
+        catalogSensors = self.getCatalogEntry()["sensors"]
+        with http_client.Executor(self.MAX_WORKERS) as executor:
+            indexFuture = executor.submit(self.getLevelIndexData)
+            valueFutures = [
+                executor.submit(self.getSensorValue, row["id"])
+                for row in catalogSensors
+            ]
+            levelIndexArray = indexFuture.result()
+
         sensors = []
-        for row in self.getJson(url):
-            value = self.getSensorValue(row["id"])
-            if value[1] > 1:  # czasem tu schodzi none
+        for row, valueFuture in zip(catalogSensors, valueFutures):
+            try:
+                value = valueFuture.result()
+            except (KeyError, IndexError):
+                self.__logger.error("::: Brak danych z czujnika %s", row["id"])
+                continue
+            if value[1] is not None and value[1] > 1:  # czasem tu schodzi none
                 qualityIndexName = self.safe_name(value[0]) + "IndexLevel"
                 if qualityIndexName in levelIndexArray:
                     index = levelIndexArray[qualityIndexName]["indexLevelName"]
@@ -79,7 +162,7 @@ class AirPollutionSq9atk(SR0WXModule):
                     [
                         row["id"],
                         qualityIndexName,
-                        self.safe_name(row["param"]["paramName"]),
+                        self.safe_name(row["paramName"]),
                         value[1],
                         self.safe_name(index),
                     ]
@@ -104,7 +187,7 @@ class AirPollutionSq9atk(SR0WXModule):
         message = []
         for _, _, gas, concentration, level, *_ in data:
             message.append(gas)
-            message.extend(self.__language.read_micrograms(int(concentration)).split())
+            message.extend(self.__language.read_micrograms(int(concentration)))
             if lvl := levels.get(level):
                 message.append(lvl)
             message.append("_")
@@ -118,7 +201,9 @@ class AirPollutionSq9atk(SR0WXModule):
         valuesMessage = self.prepareMessage(sensorsData)
 
         message = ["_", "informacja_o_skaz_eniu_powietrza", "_"]
-        message += ["stacja_pomiarowa", self.safe_name(self.getStationName()), "_"]
+        stationName = self.getStationName()
+        if stationName:
+            message += ["stacja_pomiarowa", self.safe_name(stationName), "_"]
         message += valuesMessage
 
         return {
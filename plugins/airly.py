@@ -3,18 +3,20 @@
 
 import json as JSON
 import logging
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import datetime
 
+import requests
+
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class AirlySq9atk(SR0WXModule):
     """Klasa pobierająca dane o zanieszczyszczeniach"""
 
+    # cache lifetime, in seconds
+    DATA_TTL = 10 * 60
+
     def __init__(
         self,
         language,
@@ -55,15 +57,16 @@ class AirlySq9atk(SR0WXModule):
         self.__logger.info("::: Przetwarzam dane...\n")
 
         message = [
-            " _ ",
-            " informacja_o_skaz_eniu_powietrza ",
-            " _ ",
-            " godzina ",
-            self.getHour(),
-            " _ stan_ogolny ",
+            "_",
+            "informacja_o_skaz_eniu_powietrza",
+            "_",
+            "godzina",
+            *self.getHour(),
+            "_",
+            "stan_ogolny",
             self.__levels[jsonData["current"]["indexes"][0]["level"]],
-            self.getPollutionLevel(jsonData["current"]["values"]),
-            " _ ",
+            *self.getPollutionLevel(jsonData["current"]["values"]),
+            "_",
         ]
         return {
             "message": message,
@@ -71,19 +74,19 @@ class AirlySq9atk(SR0WXModule):
         }
 
     def getPollutionLevel(self, json):
-        message = ""
+        message = []
         for item in json:
             if item["name"] == "PM1":
-                message += " _ pyl__zawieszony_pm1 "
-                message += self.__language.read_micrograms(int(item["value"])) + " "
+                message += ["_", "pyl__zawieszony_pm1"]
+                message += self.__language.read_micrograms(int(item["value"]))
 
             if item["name"] == "PM25":
-                message += " _ pyl__zawieszony_pm25 "
-                message += self.__language.read_micrograms(int(item["value"])) + " "
+                message += ["_", "pyl__zawieszony_pm25"]
+                message += self.__language.read_micrograms(int(item["value"]))
 
             if item["name"] == "PM10":
-                message += " _ pyl__zawieszony_pm10 "
-                message += self.__language.read_micrograms(int(item["value"])) + " "
+                message += ["_", "pyl__zawieszony_pm10"]
+                message += self.__language.read_micrograms(int(item["value"]))
         return message
 
     def prepareApiServiceUrl(self):
@@ -104,28 +107,22 @@ class AirlySq9atk(SR0WXModule):
         return urls[self.__mode]
 
     def getAirlyData(self, url):
-        request = urllib.request.Request(
-            url, headers={"Accept": "application/json", "apikey": self.__api_key}
-        )
+        headers = {"Accept": "application/json", "apikey": self.__api_key}
         try:
-            webFile = urllib.request.urlopen(request, None, 30)
-            return webFile.read()
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return http_cache.get(url, self.DATA_TTL, headers=headers)
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
         return ""
 
     def getHour(self):
         time = ":".join([str(datetime.now().hour), str(datetime.now().minute)])
         datetime_object = datetime.strptime(time, "%H:%M")
-        msg = self.__language.read_datetime(datetime_object, "%H %M")
-        return msg
+        return self.__language.read_datetime(datetime_object, "%H %M")
 
     def getVisibility(self, value):
-        msg = " _ "
-        msg += " widocznosc " + self.__language.read_distance(int(value / 1000))
-        return msg
+        return ["_", "widocznosc", *self.__language.read_distance(int(value / 1000))]
 
 
 def create(config):
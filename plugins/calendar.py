@@ -3,18 +3,20 @@
 
 import logging
 import re
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import datetime
 
+import requests
+
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class CalendarSq9atk(SR0WXModule):
     """Klasa pobierająca dane kalendarzowe"""
 
+    # cache lifetime, in seconds
+    DATA_TTL = 60 * 60
+
     def __init__(self, language, service_url, city_id=3094802, **kwargs):
         self.__service_url = service_url
         self.__city_id = city_id
@@ -24,12 +26,11 @@ class CalendarSq9atk(SR0WXModule):
     def downloadFile(self, url):
         try:
             self.__logger.info("::: Odpytuję adres: " + url)
-            webFile = urllib.request.urlopen(url, None, 30)
-            return webFile.read()
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return http_cache.get(url, self.DATA_TTL)
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
 
     def getSunsetSunrise(self):
         self.__logger.info("::: Pobieram dane o wschodzie i zachodzie słońca")
@@ -53,10 +54,10 @@ class CalendarSq9atk(SR0WXModule):
 
         message = ["_", "kalendarium", "_"]
         message.extend(["wscho_d_sl_on_ca", "godzina"])
-        message.extend(self.hourToNumbers(times["sunrise"]).split())
+        message.extend(self.hourToNumbers(times["sunrise"]))
         message.append("_")
         message.extend(["zacho_d_sl_on_ca", "godzina"])
-        message.extend(self.hourToNumbers(times["sunset"]).split())
+        message.extend(self.hourToNumbers(times["sunset"]))
         message.append("_")
         message.append("_")
 
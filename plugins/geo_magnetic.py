@@ -3,18 +3,20 @@
 
 import logging
 import re
-import socket
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
 
+import requests
+
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class GeoMagneticSq9atk(SR0WXModule):
     """Klasa pobierająca info o sytuacji geomagnetycznej"""
 
+    # cache lifetime, in seconds
+    DATA_TTL = 60 * 60
+
     def __init__(self, language, service_url, **kwargs):
         self.__language = language
         self.__service_url = service_url
@@ -55,19 +57,16 @@ class GeoMagneticSq9atk(SR0WXModule):
 
     def downloadDataFromUrl(self, url):
         self.__logger.info("::: Odpytuję adres: " + url)
-        opener = urllib.request.build_opener()
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 5.1; rv:10.0.1) Gecko/20100101 Firefox/10.0.1",
         }
-        opener.addheaders = list(headers.items())
         try:
-            response = opener.open(url)
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return http_cache.get(url, self.DATA_TTL, headers=headers)
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
-
-        return response.read()
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
+        return b""
 
     def getDataParsedHtmlData(self):
         self.__logger.info("::: Pobieram informacje...")
@@ -7,6 +7,7 @@ from typing import Iterable
 import msgspec
 import requests
 
+from lib import http_cache, http_client
 from sr0wx_module import SR0WXModule
 
 
@@ -45,6 +46,13 @@ class WGStatus(msgspec.Struct):
         return self.river.split("(")[0].strip()
 
 
+# single station of danepubliczne.imgw.pl bulk hydro data
+class PublicHydroStation(msgspec.Struct):
+    id_stacji: int
+    stan_wody: float | None = None
+    stan_wody_data_pomiaru: str | None = None
+
+
 class WGData(msgspec.Struct):
     id: int
     status: WGStatus
@@ -70,11 +78,27 @@ class ImgwPodestSq9atk(SR0WXModule):
         "up": "tendencja_wzrostowa",
         "down": "tendencja_spadkowa",
     }
-
-    def __init__(self, service_url: str, water_gauges: Iterable[int], **kwargs):
+    # cache lifetime, in seconds
+    DATA_TTL = 10 * 60
+    # lifetime of per-gauge data (names, alarm and warning levels) in bulk mode
+    GAUGE_TTL = 24 * 60 * 60
+    # in bulk mode, the trend is the change since the per-gauge reading, if it
+    # isn't older than this
+    TREND_MAX_AGE = datetime.timedelta(hours=1)
+    # number of water gauges downloaded at once
+    MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        service_url: str,
+        water_gauges: Iterable[int],
+        bulk_url: str | None = None,
+        **kwargs,
+    ):
         super().__init__()
         self.__logger = logging.getLogger(__name__)
         self._service_url = service_url
+        self._bulk_url = bulk_url
         self._selected_water_gauges = water_gauges
         # debug mode, loads data from disk
         self._offline: bool = kwargs.pop("offline_mode", False)
@@ -82,37 +106,100 @@ class ImgwPodestSq9atk(SR0WXModule):
             self.__logger.info("Debug mode: IMGW data loaded from disk!")
         self._wg_data: dict[int, WGData | None] = {}
 
-    def load_wg_data(self):
-        self.__logger.info("::: Downloading water gauge data...")
-        for wg in self._selected_water_gauges:
-            self._wg_data[wg] = None
+    def load_wg(self, wg, ttl):
+        self.__logger.debug("Water gauge ID: %s", wg)
+        if not self._offline:
+            content = http_cache.get(self._service_url.format(wg), ttl)
+        else:
+            with open(
+                os.path.join("test", "data", f"test_{wg}_map.json"), encoding="utf-8"
+            ) as f:
+                content = f.read()
+        # strict=False to allow automatic gauge ID conversion from str
+        return msgspec.json.decode(content, type=WGData, strict=False)
+
+    def load_all_wgs(self, ttl):
+        """Loads data of all selected water gauges in parallel. Gauges which
+        couldn't be loaded are left out."""
+        wg_data = {}
+        futures = http_client.map_concurrently(
+            lambda wg: self.load_wg(wg, ttl),
+            self._selected_water_gauges,
+            self.MAX_WORKERS,
+        )
+        for wg, future in zip(self._selected_water_gauges, futures):
             try:
-                self.__logger.debug("Water gauge ID: %s", wg)
-                if not self._offline:
-                    resp = requests.request("GET", self._service_url.format(wg))
-                    resp.raise_for_status()
-                    # strict=False to allow automatic gauge ID conversion from str
-                    self._wg_data[wg] = msgspec.json.decode(
-                        resp.content, type=WGData, strict=False
-                    )
-                else:
-                    with open(
-                        os.path.join("test", "data", f"test_{wg}_map.json"),
-                        encoding="utf-8",
-                    ) as f:
-                        self._wg_data[wg] = msgspec.json.decode(
-                            f.read(), type=WGData, strict=False
-                        )
-
-            except requests.exceptions.HTTPError:
+                wg_data[wg] = future.result()
+            except requests.exceptions.RequestException:
                 self.__logger.exception("Couldn't download water gauge %s data", wg)
-                raise
             except OSError:
                 self.__logger.exception("Couldn't load data from disk")
-                raise
-            except msgspec.ValidationError:
+            except msgspec.DecodeError:
                 self.__logger.exception("There is an error in received data")
-                raise
+        return wg_data
+
+    @staticmethod
+    def _utc(date):
+        # per-gauge dates are given in UTC
+        if date.tzinfo is None:
+            return date.replace(tzinfo=datetime.timezone.utc)
+        return date
+
+    def apply_bulk_data(self, wg_data):
+        """Updates current water levels in ``wg_data`` with bulk data of all
+        stations. Gauges missing from bulk data are left out.
+
+        Bulk data has no trend, so it's derived from the change since the
+        per-gauge reading, which may be cached for up to ``GAUGE_TTL``. If that
+        reading is older than ``TREND_MAX_AGE``, the trend is unknown (empty) and
+        isn't announced."""
+        content = http_cache.get(self._bulk_url, self.DATA_TTL)
+        stations = msgspec.json.decode(
+            content, type=list[PublicHydroStation], strict=False
+        )
+        index = {station.id_stacji: station for station in stations}
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        for wg in list(wg_data):
+            station = index.get(wg)
+            if station is None or station.stan_wody is None:
+                self.__logger.error("::: No bulk data for water gauge %s", wg)
+                del wg_data[wg]
+                continue
+
+            status = wg_data[wg].status
+            previous = status.currentState
+            date = previous.date
+            if station.stan_wody_data_pomiaru:
+                date = datetime.datetime.fromisoformat(station.stan_wody_data_pomiaru)
+            status.previousState = previous
+            status.currentState = WGWaterState(date, station.stan_wody)
+            if now - self._utc(previous.date) > self.TREND_MAX_AGE:
+                wg_data[wg].trend = ""
+            elif station.stan_wody > previous.value:
+                wg_data[wg].trend = "up"
+            elif station.stan_wody < previous.value:
+                wg_data[wg].trend = "down"
+            else:
+                wg_data[wg].trend = "const"
+
+    def load_wg_data(self):
+        self.__logger.info("::: Downloading water gauge data...")
+        if self._bulk_url is None or self._offline:
+            self._wg_data = self.load_all_wgs(self.DATA_TTL)
+            return
+
+        # per-gauge data only provides alarm and warning levels here, current
+        # levels of all gauges come in one bulk request
+        wg_data = self.load_all_wgs(self.GAUGE_TTL)
+        try:
+            self.apply_bulk_data(wg_data)
+        except (requests.exceptions.RequestException, msgspec.DecodeError):
+            self.__logger.exception(
+                "Couldn't load bulk hydro data, downloading water gauges one by one"
+            )
+            wg_data = self.load_all_wgs(self.DATA_TTL)
+        self._wg_data = wg_data
 
     def get_data(self):
         message = ["_", "_"]
@@ -130,11 +217,11 @@ class ImgwPodestSq9atk(SR0WXModule):
                     wg_name_sample = self.safe_name(w.name.lower())
 
                     wg_id_for_log = f"{wg_id} - {river} - {w.name}"
-                    trend_samples = [
-                        wg_name_sample,
-                        self.TRENDS.get(w.trend, "beep"),
-                        "_",
-                    ]
+                    trend_samples = [wg_name_sample]
+                    # unknown trends (in bulk mode) aren't announced
+                    if w.trend:
+                        trend_samples.append(self.TRENDS.get(w.trend, "beep"))
+                    trend_samples.append("_")
                     if w.has_alarm:
                         self.__logger.info("::: Alarm state: %s", wg_id_for_log)
                         if river_sample not in alarm_states:
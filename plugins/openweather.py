@@ -3,18 +3,21 @@
 
 import json as JSON
 import logging
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import datetime
 
+import requests
+
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class OpenWeatherSq9atk(SR0WXModule):
     """Klasa pobierająca dane o promieniowaniu"""
 
+    # cache lifetime, in seconds
+    WEATHER_TTL = 10 * 60
+    FORECAST_TTL = 3 * 60 * 60
+
     def __init__(self, language, api_key, latitude, longitude, service_url, **kwargs):
         self.__service_url = service_url
         self.__lat = latitude
@@ -80,22 +83,20 @@ class OpenWeatherSq9atk(SR0WXModule):
             804: "pochmurno",
         }
 
-    def downloadFile(self, url):
+    def downloadFile(self, url, ttl=0):
         try:
-            webFile = urllib.request.urlopen(url, None, 30)
-            return webFile.read()
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return http_cache.get(url, ttl)
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
         return ""
 
     def getHour(self):
         # TODO: simplify!!
         time = ":".join([str(datetime.now().hour), str(datetime.now().minute)])
         datetime_object = datetime.now().strptime(time, "%H:%M")
-        time_words = self.__language.read_datetime(datetime_object, "%H %M")
-        return time_words.split()
+        return list(self.__language.read_datetime(datetime_object, "%H %M"))
 
     def getWeather(self, json):
         message = ["_"]
@@ -108,32 +109,30 @@ class OpenWeatherSq9atk(SR0WXModule):
         msg = []
         if json["all"] > 0:
             msg.extend(["_", "pokrywa_chmur"])
-            msg.extend(self.__language.read_percent(int(json["all"])).split())
+            msg.extend(self.__language.read_percent(int(json["all"])))
         return msg
 
     def getMainConditions(self, json):
         msg = ["_"]
         msg += ["temperatura"]
-        msg.extend(self.__language.read_temperature(int(json["temp"])).split())
+        msg.extend(self.__language.read_temperature(int(json["temp"])))
         msg += ["cisnienie"]
-        msg.extend(self.__language.read_pressure(int(json["pressure"])).split())
+        msg.extend(self.__language.read_pressure(int(json["pressure"])))
         msg += ["wilgotnosc"]
-        msg.extend(self.__language.read_percent(int(json["humidity"])).split())
+        msg.extend(self.__language.read_percent(int(json["humidity"])))
         return msg
 
     def getVisibility(self, json):
         msg = ["_"]
         msg += ["widocznosc"]
-        msg.extend(self.__language.read_distance(int(json / 1000)).split())
+        msg.extend(self.__language.read_distance(int(json / 1000)))
         return msg
 
     def getWind(self, json):
         msg = ["_"]
         msg += ["predkosc_wiatru"]
-        msg.extend(self.__language.read_speed(int(json["speed"])).split())
-        msg.extend(
-            self.__language.read_speed(int(json["speed"] / 1000 * 3600), "kmph").split()
-        )
+        msg.extend(self.__language.read_speed(int(json["speed"])))
+        msg.extend(self.__language.read_speed(int(json["speed"] / 1000 * 3600), "kmph"))
 
         if "deg" in json:
             msg += ["_", "wiatr"]
@@ -155,7 +154,7 @@ class OpenWeatherSq9atk(SR0WXModule):
                 msg += ["polnocno", "zachodni"]
             if 337 <= json["deg"] <= 360:
                 msg += ["polnocny"]
-            msg.extend(self.__language.read_degrees(int(json["deg"])).split())
+            msg.extend(self.__language.read_degrees(int(json["deg"])))
         return msg
 
     def get_data(self):
@@ -171,7 +170,9 @@ class OpenWeatherSq9atk(SR0WXModule):
             + self.__api_key
         )
         self.__logger.info(weather_service_url)
-        weatherJson = JSON.loads(self.downloadFile(weather_service_url))
+        weatherJson = JSON.loads(
+            self.downloadFile(weather_service_url, self.WEATHER_TTL)
+        )
 
         self.__logger.info("::: Pobieram dane prognozy pogody...")
 
@@ -185,7 +186,9 @@ class OpenWeatherSq9atk(SR0WXModule):
             + self.__api_key
         )
         self.__logger.info(forecast_service_url)
-        forecastJsonAll = JSON.loads(self.downloadFile(forecast_service_url))
+        forecastJsonAll = JSON.loads(
+            self.downloadFile(forecast_service_url, self.FORECAST_TTL)
+        )
 
         self.__logger.info("::: Przetwarzam dane...\n")
 
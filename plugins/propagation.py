@@ -1,20 +1,23 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
 
+import hashlib
+import io
 import logging
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
 
+import requests
 from PIL import Image
 
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class PropagationSq9atk(SR0WXModule):
     """Klasa pobierająca dane kalendarzowe"""
 
+    # cache lifetime, in seconds
+    DATA_TTL = 60 * 60
+
     def __init__(self, language, service_url, **kwargs):
         self.__service_url = service_url
         self.__language = language
@@ -29,6 +32,10 @@ class PropagationSq9atk(SR0WXModule):
             6: {"day": {"x": 50, "y": 270}, "night": {"x": 100, "y": 270}},
         }
 
+        # hash of the last analysed image and conditions read from it
+        self.__imageHash = None
+        self.__conditions = None
+
         self.__levels = {
             "#17e624": "warunki_podwyzszone",  # zielony
             "#e6bc17": "warunki_normalne",  # żółty
@@ -42,13 +49,11 @@ class PropagationSq9atk(SR0WXModule):
     def downloadImage(self, url):
         try:
             self.__logger.info("::: Odpytuję adres: " + url)
-            webFile = urllib.request.URLopener()
-            webFile.retrieve(url, "propagacja.png")
-            return Image.open("propagacja.png", "r")
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return http_cache.get(url, self.DATA_TTL)
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
         except Exception:
             self.__logger.exception("Unexpected error")
             raise
@@ -72,15 +77,35 @@ class PropagationSq9atk(SR0WXModule):
             self.__logger.exception("Error in collecting band conditions")
             return []
 
+    def getBandConditions(self, content):
+        """Reads conditions of all bands from the image, decoded in memory.
+        Unchanged image isn't analysed again."""
+        if content is None:
+            return {"day": [], "night": []}
+
+        imageHash = hashlib.sha256(content).digest()
+        if imageHash == self.__imageHash:
+            self.__logger.info("::: Obraz bez zmian")
+            return self.__conditions
+
+        image = Image.open(io.BytesIO(content))
+        self.__conditions = {
+            dayTime: self.collectBandConditionsFromImage(image, dayTime)
+            for dayTime in ("day", "night")
+        }
+        self.__imageHash = imageHash
+        return self.__conditions
+
     def get_data(self):
-        image = self.downloadImage(self.__service_url)
+        content = self.downloadImage(self.__service_url)
 
         self.__logger.info("::: Przetwarzam dane...\n")
+        conditions = self.getBandConditions(content)
 
         message = ["_", "informacje_o_propagacji", "_", "dzien", "_", "_", "pasma", "_"]
-        message.extend(self.collectBandConditionsFromImage(image, "day"))
+        message.extend(conditions["day"])
         message.extend(["_", "noc", "_", "_", "pasma", "_"])
-        message.extend(self.collectBandConditionsFromImage(image, "night"))
+        message.extend(conditions["night"])
         message.append("_")
 
         return {
@@ -2,17 +2,19 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
 
+import requests
+
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class RadioactiveSq9atk(SR0WXModule):
     """Klasa pobierająca dane o promieniowaniu"""
 
+    # cache lifetime, in seconds
+    DATA_TTL = 10 * 60
+
     def __init__(self, language, service_url, sensor_id, **kwargs):
         self.__service_url = service_url
         self.__sensor_id = sensor_id
@@ -22,13 +24,12 @@ class RadioactiveSq9atk(SR0WXModule):
     def downloadFile(self, url):
         try:
             self.__logger.info("::: Odpytuję adres: " + url)
-            webFile = urllib.request.urlopen(url, None, 30)
-            return webFile.read()
-        except urllib.error.URLError as e:
-            self.__logger.error("Connection error", exc_info=e)
-        except socket.timeout:
+            return http_cache.get(url, self.DATA_TTL)
+        except requests.exceptions.Timeout:
             self.__logger.error("Connection timed out!")
-        return ""
+        except requests.exceptions.RequestException as e:
+            self.__logger.error("Connection error", exc_info=e)
+        return b""
 
     def isSensorMatchedById(self, sensorId, string):
         return f"Details sensor {sensorId}" in string
@@ -82,16 +83,20 @@ class RadioactiveSq9atk(SR0WXModule):
             self.__logger.error("::: Brak danych z czujnika: %s...\n", self.__sensor_id)
             return {}
 
-        averageValue = (
-            ["wartos_c__aktualna"]
-            + self.__language.read_decimal(msvCurrent).split(" ")
-            + ["mikrosjiwerta", "na_godzine_", "_"]
-        )
-        currentValue = (
-            ["s_rednia_wartos_c__dobowa"]
-            + self.__language.read_decimal(msvAverage).split(" ")
-            + ["mikrosjiwerta", "na_godzine_", "_"]
-        )
+        averageValue = [
+            "wartos_c__aktualna",
+            *self.__language.read_decimal(msvCurrent),
+            "mikrosjiwerta",
+            "na_godzine_",
+            "_",
+        ]
+        currentValue = [
+            "s_rednia_wartos_c__dobowa",
+            *self.__language.read_decimal(msvAverage),
+            "mikrosjiwerta",
+            "na_godzine_",
+            "_",
+        ]
 
         message = ["_", "poziom_promieniowania", "_"] + averageValue + currentValue
 
@@ -1,25 +1,69 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
 
+import hashlib
+import io
 import logging
+import math
 import re
 
+import numpy
 import requests
 from PIL import Image
 
+from lib import http_cache
 from sr0wx_module import SR0WXModule
 
 
 class VhfTropoSq9atk(SR0WXModule):
     """Klasa pobierająca dane kalendarzowe"""
 
-    def __init__(self, language, service_url, longitude, latitude, **kwargs):
+    # cache lifetime, in seconds
+    DATA_TTL = 30 * 60
+    # score of every colour of the map legend, other colours score 0;
+    # white and black pixels (background, borders) are skipped
+    PALETTE = {
+        0x141414: 0.00,  # czarny
+        0x8200DC: 1.00,  # fioletowy
+        0x3377FF: 2.00,  # błękitny
+        0x02D0A1: 3.00,  # pistacjowy
+        0xA0E632: 4.00,  # cytrynowy
+        0xE6DC32: 5.00,  # żółty
+        0xE6AF2D: 6.00,  # musztardowy
+        0xF08228: 7.00,  # pomarańczowy
+        0xFA3C3C: 8.00,  # czerwony
+        0xFF80C0: 9.00,  # różowy
+        0xFFB4DC: 10.00,  # różowy pastelowy
+        0xCC86CC: 11.00,  # różowy szary
+        0xC0C0C0: 12.00,  # szary
+    }
+    SKIPPED_COLORS = (0xFFFFFF, 0x000000)
+    DIRECTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+    EARTH_RADIUS = 6371.0
+
+    def __init__(
+        self,
+        language,
+        service_url,
+        longitude,
+        latitude,
+        bearings=16,
+        rings=(100, 300, 600),
+        **kwargs,
+    ):
         self.__service_url = service_url
         self.__language = language
         self.__logger = logging.getLogger(__name__)
 
         self.__areaSize = 70
-        self.__colorSampleScatter = 5
+        # directions and distances (in km) at which conditions are checked
+        self.__bearings = [360 * i / bearings for i in range(bearings)]
+        self.__rings = list(rings)
+        # crop box of the map within the image
+        self.__mapBox = (43, 67, 888, 654)
+        # hash of the last analysed map and conditions read from it
+        self.__mapHash = None
+        self.__conditions = None
 
         self.__qthLon = float(longitude)
         self.__qthLat = float(latitude)
@@ -32,13 +76,11 @@ class VhfTropoSq9atk(SR0WXModule):
 
     def getHtmlFromUrl(self, url):
         try:
-            resp = requests.get(url)
-            if resp.status_code == 200:
-                return resp.content
-            else:
-                print("HTML response error")
-                return None
+            return http_cache.get(url, self.DATA_TTL)
 
+        except requests.exceptions.HTTPError:
+            print("HTML response error")
+            return None
         except requests.exceptions.RequestException as e:
             print(("HTML download error: %s" % e))
             return None
@@ -56,33 +98,23 @@ class VhfTropoSq9atk(SR0WXModule):
         else:
             return None
 
-    def downloadMapFile(self, mapUrl, targetFileName):
+    def downloadMap(self, mapUrl):
         try:
             self.__logger.info("::: Odpytuję adres: " + mapUrl.decode("utf-8"))
-            response = requests.get(mapUrl, timeout=30)
-
-            with open(targetFileName, "wb") as mapFile:
-                mapFile.write(response.content)
+            return http_cache.get(mapUrl.decode("utf-8"), self.DATA_TTL)
 
         except requests.exceptions.Timeout:
             print("Przekroczono czas oczekiwania")
         except Exception as e:
             print(("Błąd pobierania mapy: %s" % e))
-        return
-
-    def readMapImageFile(self, fileName):
-        mapImg = Image.open(fileName, "r")
-        mapRgbImg = mapImg.convert("RGB")
-        mapCropped = mapRgbImg.crop((43, 67, 888, 654))
-        try:
-            mapCropped.save(fileName)
+        return None
 
-        except Exception as e:
-            print(("Błąd odczytu pliku z mapą: %s" % e))
-        return mapCropped
+    def readMapImage(self, content):
+        """Decodes the map in memory; only the cropped part is converted to RGB."""
+        mapImg = Image.open(io.BytesIO(content))
+        return mapImg.crop(self.__mapBox).convert("RGB")
 
     def lonLatToMapXY(self, lon, lat, imgWidth, imgHeight):
-        self.__logger.info("::: Przetwarzam dane...")
         imgWidth = float(imgWidth)
         imgHeight = float(imgHeight)
         lonRange = self.__mapLonEnd - self.__mapLonStart
@@ -94,120 +126,100 @@ class VhfTropoSq9atk(SR0WXModule):
 
         return int(pixelX), int(pixelY)
 
-    def prepareSamplesCoordinates(self, x_center, y_center, size, maxWidth, maxHeight):
+    def classifyMap(self, mapImg):
+        """Converts the map into per-pixel scores (by ``PALETTE``) and a mask of
+        pixels which count."""
+        rgb = numpy.asarray(mapImg, dtype=numpy.uint32)
+        packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+        colors = numpy.array(sorted(self.PALETTE), dtype=numpy.uint32)
+        scores = numpy.array([self.PALETTE[c] for c in sorted(self.PALETTE)])
+        index = numpy.searchsorted(colors, packed).clip(max=len(colors) - 1)
+        known = colors[index] == packed
+        mask = ~numpy.isin(packed, self.SKIPPED_COLORS)
+        return numpy.where(known & mask, scores[index], 0.0), mask
+
+    def summedAreaTables(self, scoreMap):
+        """Returns summed-area tables of scores and of counted pixels, so that a
+        sum over any window takes four lookups."""
+        return tuple(
+            numpy.pad(table.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+            for table in (scoreMap[0], scoreMap[1].astype(numpy.int64))
+        )
+
+    def destination(self, bearing, distance):
+        """Returns lon, lat of the point ``distance`` km from QTH at ``bearing``."""
+        lat1 = math.radians(self.__qthLat)
+        lon1 = math.radians(self.__qthLon)
+        theta = math.radians(bearing)
+        delta = distance / self.EARTH_RADIUS
+        lat2 = math.asin(
+            math.sin(lat1) * math.cos(delta)
+            + math.cos(lat1) * math.sin(delta) * math.cos(theta)
+        )
+        lon2 = lon1 + math.atan2(
+            math.sin(theta) * math.sin(delta) * math.cos(lat1),
+            math.cos(delta) - math.sin(lat1) * math.sin(lat2),
+        )
+        return math.degrees(lon2), math.degrees(lat2)
+
+    def windowBounds(self, x_center, y_center, size, maxWidth, maxHeight):
         half_size = size // 2
 
-        if y_center + half_size > maxHeight:
-            y_center = maxHeight - half_size
+        if y_center + half_size >= maxHeight:
+            y_center = maxHeight - 1 - half_size
 
         if y_center - half_size < 0:
             y_center = half_size
 
-        if x_center + half_size > maxWidth:
-            x_center = maxWidth - half_size
+        if x_center + half_size >= maxWidth:
+            x_center = maxWidth - 1 - half_size
 
         if x_center - half_size < 0:
             x_center = half_size
 
-        coordinates = []
-        for dx in range(-half_size, half_size + 1):
-            for dy in range(-half_size, half_size + 1):
-                coordinates.append((x_center + dx, y_center + dy))
-
-        return coordinates[:: self.__colorSampleScatter]
-
-    def collectSamplesColors(self, image, coordinates):
-        colors = []
-        for x, y in coordinates:
-            pixel_value = image.getpixel((x, y))
-            colorHex = "#%02x%02x%02x" % pixel_value
-            if colorHex != "#ffffff" and colorHex != "#000000":
-                colors.append(colorHex)
-
-        return colors
-
-    def calculateColorsOccurence(self, input_array):
-        total_elements = len(input_array)
-        frequency_dict = {}
-
-        for value in input_array:
-            if value in frequency_dict:
-                frequency_dict[value] += 1
-            else:
-                frequency_dict[value] = 1
-
-        percentage_frequencies = {}
-        for key, value in list(frequency_dict.items()):
-            percentage = (value / float(total_elements)) * 100
-            percentage_frequencies[key] = percentage
-
-        return sorted(
-            list(percentage_frequencies.items()), key=lambda item: item[1], reverse=True
+        return (
+            int(x_center - half_size),
+            int(y_center - half_size),
+            int(x_center + half_size + 1),
+            int(y_center + half_size + 1),
         )
 
-    def getColorPunctation(self, colorHex):
-        colors = {
-            "#141414": 0.00,  # czarny
-            "#8200dc": 1.00,  # fioletowy
-            "#3377ff": 2.00,  # błękitny
-            "#02d0a1": 3.00,  # pistacjowy
-            "#a0e632": 4.00,  # cytrynowy
-            "#e6dc32": 5.00,  # żółty
-            "#e6af2d": 6.00,  # musztardowy
-            "#f08228": 7.00,  # pomarańczowy
-            "#fa3c3c": 8.00,  # czerwony
-            "#ff80c0": 9.00,  # różowy
-            "#ffb4dc": 10.00,  # różowy pastelowy
-            "#cc86cc": 11.00,  # różowy szary
-            "#c0c0c0": 12.00,  # szary
-        }
-
-        result = False
-        for color, value in colors.items():
-            if color == colorHex:
-                result = value
-        return result
-
-    def countVHFCondition(self, colorsPercentage):
-        divider = 0.00
-        score = 0.00
-        for row in colorsPercentage:
-            colorHex = row[0]
-            percentage = row[1]
-            colorPunctation = self.getColorPunctation(colorHex)
-            divider += percentage
-            score += percentage * colorPunctation
-        conditionValue = score / divider
-
-        return conditionValue
-
-    def getLocationCondition(self, mapImg, x, y):
-        maxWidth, maxHeight = mapImg.size
-
-        samplesCoordinates = self.prepareSamplesCoordinates(
-            x, y, self.__areaSize, maxWidth, maxHeight
-        )
-        samples = self.collectSamplesColors(mapImg, samplesCoordinates)
-
-        occurences = self.calculateColorsOccurence(samples)
-        locationConditionValue = self.countVHFCondition(occurences)
-
-        return locationConditionValue
-
-    def getDirectionalConditions(self, mapImg, x, y):
-        shift = self.__areaSize / 2
-        shift = self.__areaSize
-
-        return {
-            "N": self.getLocationCondition(mapImg, x, y - shift),
-            "NE": self.getLocationCondition(mapImg, x + shift, y - shift),
-            "E": self.getLocationCondition(mapImg, x + shift, y),
-            "SE": self.getLocationCondition(mapImg, x + shift, y + shift),
-            "S": self.getLocationCondition(mapImg, x, y + shift),
-            "SW": self.getLocationCondition(mapImg, x - shift, y + shift),
-            "W": self.getLocationCondition(mapImg, x - shift, y),
-            "NW": self.getLocationCondition(mapImg, x - shift, y - shift),
-        }
+    def getLocationCondition(self, tables, x, y):
+        """Returns mean score of all counted pixels of the window around x, y."""
+        scores, counts = tables
+        maxHeight, maxWidth = scores.shape[0] - 1, scores.shape[1] - 1
+
+        x0, y0, x1, y1 = self.windowBounds(x, y, self.__areaSize, maxWidth, maxHeight)
+        count = counts[y1, x1] - counts[y0, x1] - counts[y1, x0] + counts[y0, x0]
+        if count == 0:
+            return 0.0
+        score = scores[y1, x1] - scores[y0, x1] - scores[y1, x0] + scores[y0, x0]
+        return float(score) / count
+
+    def getDirectionalConditions(self, tables):
+        """Checks conditions at every bearing and distance ring.
+
+        Returns the best score in each of 8 main directions and the distance
+        (in km) of the best path overall.
+        """
+        maxHeight, maxWidth = tables[0].shape[0] - 1, tables[0].shape[1] - 1
+        conditions = {}
+        best = (0.0, None)
+        for bearing in self.__bearings:
+            # half-up, not round(), which rounds halves to even and would give
+            # main directions more bearings than diagonal ones
+            direction = self.DIRECTIONS[int(bearing / 45 + 0.5) % 8]
+            for distance in self.__rings:
+                lon, lat = self.destination(bearing, distance)
+                x, y = self.lonLatToMapXY(lon, lat, maxWidth, maxHeight)
+                if not (0 <= x < maxWidth and 0 <= y < maxHeight):
+                    continue
+                score = self.getLocationCondition(tables, x, y)
+                conditions[direction] = max(conditions.get(direction, 0.0), score)
+                if score > best[0]:
+                    best = (score, distance)
+        return conditions, best[1]
 
     def getTopDirectionsValues(self, input_table):
         filtered_rows = []
@@ -223,7 +235,9 @@ class VhfTropoSq9atk(SR0WXModule):
 
         return keys
 
-    def prepareMessage(self, mainConditionValue, directionalConditionsValues):
+    def prepareMessage(
+        self, mainConditionValue, directionalConditionsValues, bestDistance=None
+    ):
         message = ["vhf_brak_szans_na_lacznosc_troposferyczna"]
 
         if mainConditionValue > 0.3:
@@ -242,7 +256,11 @@ class VhfTropoSq9atk(SR0WXModule):
             message = ["vhf_uwaga", "vhf_warunki_podwyzszone", "_"] + message
         if mainConditionValue > 0.5:
             message += ["vhf_najlepsze_warunki_w_kierunku"]
-            message += self.getTopDirectionsValues(directionalConditionsValues)
+            directions = self.getTopDirectionsValues(directionalConditionsValues)
+            if directions and bestDistance is not None:
+                # distance of the best path, after its direction
+                directions[1:1] = self.__language.read_distance(bestDistance)
+            message += directions
 
         return message
 
@@ -250,20 +268,35 @@ class VhfTropoSq9atk(SR0WXModule):
         html = self.getHtmlFromUrl(self.__service_url)
         mapUrl = self.findMapUrlInHtml(html, "imgClickAndChange")
 
-        self.downloadMapFile(mapUrl, "vhf_map.png")
+        content = self.downloadMap(mapUrl)
+        if content is None:
+            return {}
 
-        mapImg = self.readMapImageFile("vhf_map.png")
+        mapHash = hashlib.sha256(content).digest()
+        if mapHash != self.__mapHash:
+            mapImg = self.readMapImage(content)
+            mapWidth, mapHeight = mapImg.size
 
-        mapWidth, mapHeight = mapImg.size
+            self.__logger.info("::: Przetwarzam dane...")
+            x, y = self.lonLatToMapXY(self.__qthLon, self.__qthLat, mapWidth, mapHeight)
 
-        x, y = self.lonLatToMapXY(self.__qthLon, self.__qthLat, mapWidth, mapHeight)
-
-        mainConditionValue = self.getLocationCondition(mapImg, x, y)
-        directionalConditionsValues = self.getDirectionalConditions(mapImg, x, y)
+            tables = self.summedAreaTables(self.classifyMap(mapImg))
+            self.__conditions = (
+                self.getLocationCondition(tables, x, y),
+                *self.getDirectionalConditions(tables),
+            )
+            self.__mapHash = mapHash
+        else:
+            self.__logger.info("::: Mapa bez zmian")
+        mainConditionValue, directionalConditionsValues, bestDistance = (
+            self.__conditions
+        )
 
         message = ["_", "vhf_propagacja_w_pasmie_vhf", "_"]
         message.extend(
-            self.prepareMessage(mainConditionValue, directionalConditionsValues)
+            self.prepareMessage(
+                mainConditionValue, directionalConditionsValues, bestDistance
+            )
         )
         message.append("_")
 
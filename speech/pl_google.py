@@ -17,7 +17,7 @@
 
 from six import u
 import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 
 from lib import pyliczba
 
@@ -26,36 +26,48 @@ def rmv_pl_chars(string):
     return "".join([i if ord(i) < 128 else "_" for i in string]).lower()
 
 
+# unicodedata.normalize() doesn't work with ł and Ł
+ACCENTS = str.maketrans(u("ąĄćĆęĘłŁńŃóÓśŚźŹżŻ"), "aacceellnnoosszzzz")
+
+
 def ra(value):
-    return (
-        value.replace(u("ą"), "a")
-        .replace(u("Ą"), "a")
-        .replace(u("ć"), "c")
-        .replace(u("Ć"), "c")
-        .replace(u("ę"), "e")
-        .replace(u("Ę"), "e")
-        .replace(u("ł"), "l")
-        .replace(u("Ł"), "l")
-        .replace(u("ń"), "n")
-        .replace(u("Ń"), "n")
-        .replace(u("ó"), "o")
-        .replace(u("Ó"), "o")
-        .replace(u("ś"), "s")
-        .replace(u("Ś"), "s")
-        .replace(u("ź"), "z")
-        .replace(u("Ź"), "z")
-        .replace(u("ż"), "z")
-        .replace(u("Ż"), "z")
-        .lower()
-    )
+    return value.translate(ACCENTS).lower()
+
+
+class Tokens(tuple):
+    """Sample names returned by ``read_*`` methods.
+
+    Plugins can extend their messages with it directly. For older code it still
+    behaves like the space-separated string it used to be: it can be
+    ``.split()``, converted with ``str()`` and concatenated with strings.
+    """
+
+    __slots__ = ()
+
+    def split(self, sep=None):
+        return list(self)
+
+    def __str__(self):
+        return " ".join(self)
+
+    def __add__(self, other):
+        if isinstance(other, str):
+            return str(self) + other
+        return Tokens(tuple.__add__(self, other))
+
+    def __radd__(self, other):
+        if isinstance(other, str):
+            return other + str(self)
+        return NotImplemented
 
 
 def remove_accents(function):
-    """unicodedata.normalize() doesn't work with ł and Ł"""
+    """Strips accents from text returned by ``function`` and splits it into
+    ``Tokens``. unicodedata.normalize() doesn't work with ł and Ł"""
 
     @wraps(function)
     def wrapper(*args, **kwargs):
-        return ra(function(*args, **kwargs))
+        return Tokens(ra(function(*args, **kwargs)).split())
 
     return wrapper
 
@@ -64,6 +76,57 @@ def _(text):
     return text.replace(" ", "_")
 
 
+# Forms of units, as expected by pyliczba.cosslownie(): one, two to four, five
+# and more. Tuples, as they're part of the key of read_number()'s cache.
+HECTOPASCALS = ("hektopaskal", "hektopaskale", "hektopaskali")
+KILOMETERS = ("kilometr", "kilometry", "kilometrow")
+PERCENT = ("procent", "procent", "procent")
+CELSIUS = (_(u("stopień Celsjusza")), _("stopnie Celsjusza"), _("stopni Celsjusza"))
+SPEED_UNITS = {
+    "mps": (
+        _(u("metr na sekundę")),
+        _(u("metry na sekundę")),
+        _(u("metrów na sekundę")),
+    ),
+    "kmph": (
+        _(u("kilometr na godzinę")),
+        _(u("kilometry na godzinę")),
+        _(u("kilometrów na godzinę")),
+    ),
+}
+DEGREES = (u("stopień"), u("stopnie"), u("stopni"))
+MICROGRAMS = (
+    u("mikrogram na_metr_szes_cienny"),
+    u("mikrogramy na_metr_szes_cienny"),
+    u("mikrogramo_w na_metr_szes_cienny"),
+)
+THOUSANDTHS = (u("tysie_czna"), u("tysie_czne"), u("tysie_cznych"))
+HUNDREDTHS = (u("setna"), u("setne"), u("setnych"))
+TENTHS = (u("dziesia_ta"), u("dziesia_te"), u("dziesia_tych"))
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _verbalize(value, units, isFraction):
+    if units is None:
+        retval = pyliczba.lslownie(abs(value))
+    else:
+        retval = pyliczba.cosslownie(abs(value), units)
+
+    if isFraction:
+        if value % 1 == 0 and retval.startswith(u("jeden ")):
+            retval = retval.replace(u("jeden "), u("jedna "))
+        if value % 2 == 0 and retval.startswith(u("dwa ")):
+            retval = retval.replace(u("dwa "), u("dwie "))
+        if value % 10 % 2 == 0:
+            retval = retval.replace(u("dwa "), u("dwie "))
+
+    if retval.startswith(u("jeden tysiąc")):
+        retval = retval.replace(u("jeden tysiąc"), u("tysiąc"))
+    if value < 0:
+        retval = " ".join(("minus", retval))
+    return Tokens(ra(retval).split())
+
+
 class SR0WXLanguage(object):
     def __init__(self):
         """Nothing here for now."""
@@ -74,100 +137,44 @@ class PLGoogle(SR0WXLanguage):
     def __init__(self):
         pass
 
-    @remove_accents
     def read_number(self, value, units=None, isFraction=None):
-        """Converts numbers to text."""
-        if units is None:
-            retval = pyliczba.lslownie(abs(value))
-        else:
-            retval = pyliczba.cosslownie(abs(value), units)
-
-        if isFraction:
-            if value % 1 == 0 and retval.startswith(u("jeden ")):
-                retval = retval.replace(u("jeden "), u("jedna "))
-            if value % 2 == 0 and retval.startswith(u("dwa ")):
-                retval = retval.replace(u("dwa "), u("dwie "))
-            if value % 10 % 2 == 0:
-                retval = retval.replace(u("dwa "), u("dwie "))
-
-        if retval.startswith(u("jeden tysiąc")):
-            retval = retval.replace(u("jeden tysiąc"), u("tysiąc"))
-        if value < 0:
-            retval = " ".join(("minus", retval))
-        return retval
+        """Converts numbers to text.
+
+        Results are memoized: the same values (hours, minutes, temperatures...)
+        come back in every bulletin, so most calls are just a cache lookup.
+        """
+        if units is not None:
+            units = tuple(units)
+        return _verbalize(value, units, isFraction)
 
-    @remove_accents
     def read_pressure(self, value):
-        hPa = ["hektopaskal", "hektopaskale", "hektopaskali"]
-        return self.read_number(value, hPa)
+        return self.read_number(value, HECTOPASCALS)
 
-    @remove_accents
     def read_distance(self, value):
-        hPa = ["kilometr", "kilometry", "kilometrow"]
-        return self.read_number(value, hPa)
+        return self.read_number(value, KILOMETERS)
 
-    @remove_accents
     def read_percent(self, value):
-        percent = ["procent", "procent", "procent"]
-        return self.read_number(value, percent)
+        return self.read_number(value, PERCENT)
 
-    @remove_accents
     def read_temperature(self, value):
-        C = [_(u("stopień Celsjusza")), _("stopnie Celsjusza"), _("stopni Celsjusza")]
-        return read_number(value, C)
+        return self.read_number(value, CELSIUS)
 
-    @remove_accents
     def read_speed(self, no, unit="mps"):
-        units = {
-            "mps": [
-                _(u("metr na sekundę")),
-                _(u("metry na sekundę")),
-                _(u("metrów na sekundę")),
-            ],
-            "kmph": [
-                _(u("kilometr na godzinę")),
-                _(u("kilometry na godzinę")),
-                _(u("kilometrów na godzinę")),
-            ],
-        }
-        return read_number(no, units[unit])
+        return self.read_number(no, SPEED_UNITS[unit])
 
-    @remove_accents
     def read_degrees(self, value):
-        deg = [u("stopień"), u("stopnie"), u("stopni")]
-        return read_number(value, deg)
+        return self.read_number(value, DEGREES)
 
-    @remove_accents
     def read_micrograms(self, value):
-        deg = [
-            u("mikrogram na_metr_szes_cienny"),
-            u("mikrogramy na_metr_szes_cienny"),
-            u("mikrogramo_w na_metr_szes_cienny"),
-        ]
-        return read_number(value, deg)
+        return self.read_number(value, MICROGRAMS)
 
-    @remove_accents
     def read_decimal(self, value):
-        deg1000 = [u("tysie_czna"), u("tysie_czne"), u("tysie_cznych")]
-
-        deg100 = [
-            u("setna"),
-            u("setne"),
-            u("setnych"),
-        ]
-
-        deg10 = [
-            u("dziesia_ta"),
-            u("dziesia_te"),
-            u("dziesia_tych"),
-        ]
-
         if value % 100 == 0 and value >= 100:
-            return read_number(value // 100, deg10, True)
+            return self.read_number(value // 100, TENTHS, True)
         elif value % 10 == 0 and value > 9:
-            return read_number(value // 10, deg100, True)
+            return self.read_number(value // 10, HUNDREDTHS, True)
         else:
-            return read_number(value, deg1000, True)
+            return self.read_number(value, THOUSANDTHS, True)
 
     @remove_accents
     def read_direction(self, value, short=False):
@@ -193,9 +200,7 @@ class PLGoogle(SR0WXLanguage):
         elif type(value) == datetime.datetime:
             pass
         else:
-            raise TypeError(
-                "Either datetime must be supplied or both " "value and in_fmt"
-            )
+            raise TypeError("Either datetime must be supplied or both value and in_fmt")
 
         MONTHS = [
             u(""),
@@ -286,7 +291,7 @@ class PLGoogle(SR0WXLanguage):
                 if tm_min == 0:
                     retval.append(u("zero-zero"))
                 else:
-                    retval.append(read_number(tm_min))
+                    retval.extend(read_number(tm_min))
             elif word.startswith("%"):
                 raise ValueError("Token %s' is not supported!", word)
             else:
@@ -333,7 +338,7 @@ class PLGoogle(SR0WXLanguage):
                 retval.append(LETTERS[char])
             except KeyError:
                 try:
-                    retval.append(read_number(int(char)))
+                    retval.extend(read_number(int(char)))
                 except ValueError:
                     raise ValueError('"%s" is not a element of callsign', char)
         return " ".join(retval)
@@ -34,19 +34,24 @@
 #
 # SR0WX (core) requires the following packages:
 
+# ruff: noqa: E402
+import time
+
+# taken before all other imports, to measure how long they take
+STARTED = time.perf_counter()
+
+import concurrent.futures
 import contextlib
 import importlib
 import logging
 import logging.config
 import logging.handlers
 import os
-import socket
-import urllib.error
-import urllib.parse
-import urllib.request
-
-import numpy
-import pygame
+import signal
+import subprocess
+import sys
+import threading
+import wave
 
 try:
     import tomllib
@@ -54,9 +59,13 @@ except ImportError:
     import tomli as tomllib
 
 import argparse
-from colorama import Fore, Style
+import datetime
 
-from hw.ptt import PTT
+import plugins
+from lib import metrics, startup_profile
+from lib.scheduler import Scheduler
+
+IMPORT_TIME = time.perf_counter() - STARTED
 
 # ``os``, ``sys`` and ``time`` doesn't need further explanation, these are
 # standard Python packages.
@@ -65,16 +74,20 @@ from hw.ptt import PTT
 # uses it for reading (playing) sound samples. ``config`` is just a
 # SR0WX configuration file, and it is described separately.
 #
+# ``pygame``, ``numpy`` and the HTTP client take a while to import, so they're
+# imported (in the main block) only when the run gets to the point where they're
+# needed, e.g. ``--build-bank`` never imports the HTTP client.
+#
 # ..[#] www.pygame.org
 
-COLOR_HEADER = Fore.LIGHTMAGENTA_EX
-COLOR_OKBLUE = Fore.BLUE
-COLOR_OKGREEN = Fore.GREEN
-COLOR_WARNING = Fore.YELLOW
-COLOR_FAIL = Fore.RED
-COLOR_BOLD = Style.BRIGHT
+COLOR_HEADER = "\033[95m"
+COLOR_OKBLUE = "\033[34m"
+COLOR_OKGREEN = "\033[32m"
+COLOR_WARNING = "\033[33m"
+COLOR_FAIL = "\033[31m"
+COLOR_BOLD = "\033[1m"
 COLOR_UNDERLINE = "\033[4m"
-COLOR_ENDC = Style.RESET_ALL
+COLOR_ENDC = "\033[0m"
 
 LICENSE = """
 
@@ -102,6 +115,12 @@ You can find full list of contributors on github.com/iwane-pl/sr0wx
 DATA_SOURCES_ERROR_MSG = ["_", "zrodlo_danych_niedostepne"]
 HELLO_MSG = ["_", "tu_eksperymentalna_automatyczna_stacja_pogodowa", "sr0wx"]
 GOODBYE_MSG = ["_", "tu_sr0wx"]
+# length of the "_" pause, in milliseconds
+PAUSE_LENGTH = 500
+# how long (in milliseconds) to wait before checking again if a queued sound
+# has started playing
+QUEUE_MARGIN = 5
+ASSETS_BASE_PATH = "assets"
 
 
 #
@@ -141,6 +160,11 @@ def setup_logging(config, debug=False):
 # Modules may be also given in commandline, separated by a comma.
 
 cfg_data = {}
+# trim points and gains of samples (``lib.sample_levels.SampleLevels``), see
+# ``--analyse-samples``
+sample_levels = None
+# worker thread of the last run of every module, see ``collect_messages()``
+module_threads = {}
 
 
 def parse_args():
@@ -155,6 +179,34 @@ def parse_args():
         action="store_true",
         help="Enable test mode (disables serial port operations)",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run continuously, transmitting bulletins according to [daemon] schedule",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Save the bulletin to a WAV or OGG file instead of transmitting it",
+    )
+    parser.add_argument(
+        "--build-bank",
+        action="store_true",
+        help="Decode all samples of the configured language into a sample bank "
+        "and exit",
+    )
+    parser.add_argument(
+        "--analyse-samples",
+        action="store_true",
+        help="Measure silence and loudness of all samples of the configured "
+        "language, save their trim points and gains and exit",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Run with -X importtime and report the slowest imports",
+    )
     parser.add_argument(
         "modules", metavar="MOD", nargs="*", help="Limit modules to use"
     )
@@ -162,144 +214,353 @@ def parse_args():
     return args
 
 
-def test_internet_connection():
+def _run_module(module, name, future):
+    if not future.set_running_or_notify_cancel():
+        return
+    # attribute downloads made in this thread to the module
+    metrics.plugin.set(name)
+    run_metrics = metrics.current
+    started = time.perf_counter()
     try:
-        urllib.request.urlopen("http://google.pl", None, 30)
-        return True
-    except (urllib.error.URLError, socket.error, socket.timeout):
-        return False
+        future.set_result(module.get_data())
+        status = "ok"
+    except Exception as e:
+        future.set_exception(e)
+        status = "error"
+    run_metrics.record_plugin(name, time.perf_counter() - started, status)
 
 
 def collect_messages(modules):
-    message = []
-    sources = []
+    """Runs all modules in parallel and collects their messages in config order,
+    as a list of ``(plugin name, message, source)``.
+
+    Every module has its own deadline (``plugin_timeout`` from ``[collection]``
+    section, can be overridden with ``timeout`` in plugin's section) and the whole
+    collection has to fit in a global ``timeout`` budget. Modules which didn't
+    finish in time are skipped. Worker threads are daemonic, so a hung data source
+    doesn't keep sr0wx from finishing. In daemon mode, a module whose previous run
+    is still going is skipped (status "busy"), so its state isn't changed by two
+    runs at once.
+    """
+    collection_cfg = cfg_data.get("collection", {})
+    started = time.monotonic()
+    global_deadline = started + collection_cfg.get("timeout", 120)
+
+    jobs = []
     for module in modules:
+        name = module.__module__.split(".")[-1]
+        plugin_timeout = (
+            cfg_data["plugins"]
+            .get(name, {})
+            .get("timeout", collection_cfg.get("plugin_timeout", 60))
+        )
+        previous = module_threads.get(module)
+        if previous is not None and previous.is_alive():
+            metrics.current.set_status(name, "busy")
+            logger.error(
+                f"{COLOR_FAIL}%s is still running, skipped{COLOR_ENDC}", module
+            )
+            continue
+        logger.info(f"{COLOR_OKGREEN}starting %s...{COLOR_ENDC}", module)
+        future = concurrent.futures.Future()
+        thread = threading.Thread(
+            target=_run_module, args=(module, name, future), name=name, daemon=True
+        )
+        thread.start()
+        module_threads[module] = thread
+        deadline = min(started + plugin_timeout, global_deadline)
+        jobs.append((module, name, future, deadline))
+
+    parts = []
+    for module, name, future, deadline in jobs:
         try:
-            logger.info(f"{COLOR_OKGREEN}starting %s...{COLOR_ENDC}", module)
-            module_data = module.get_data()
-            module_message = module_data.get("message", "")
-            module_source = module_data.get("source", "")
-
-            message.extend(module_message)
-            if module_message != "" and module_source != "":
-                sources.append(module_data["source"])
+            module_data = future.result(max(deadline - time.monotonic(), 0))
+            message = segments.Message.from_list(
+                module_data.get("message", ""), PAUSE_LENGTH
+            )
+            if cfg_data["options"]["pygame_bugfix"]:
+                message.pcm = [pcm[: len(pcm) // 2] for pcm in message.pcm]
+            parts.append((name, message, module_data.get("source", "")))
+        except concurrent.futures.TimeoutError:
+            metrics.current.set_status(name, "timeout")
+            logger.error(f"{COLOR_FAIL}%s didn't finish in time{COLOR_ENDC}", module)
         except Exception:
             logger.exception(
                 f"{COLOR_FAIL}Exception when running %s{COLOR_ENDC}", module
             )
-    return message, sources
-
-
-def play_ctcss(freq, volume):
-    volume = volume * 1000
-    sampling_freq = cfg_data["playback"]["sampling_frequency"]
-    arr = numpy.array(
-        [
-            volume * numpy.sin(2.0 * numpy.pi * round(freq) * x / sampling_freq)
-            for x in range(0, sampling_freq)
-        ]
-    ).astype(numpy.int16)
-    arr2 = numpy.c_[arr, arr]
-    ctcss = pygame.sndarray.make_sound(arr2)
-    logger.info(f"{COLOR_WARNING}Playing CTCSS tone %.1fHz{COLOR_ENDC}\n", freq)
-    ctcss.play(-1)
+    logger.info("data collected in %.1fs", time.monotonic() - started)
+    return parts
 
 
-def prepare_sample_dictionary():
-    sound_samples = {}
-    for el in message:
-        if isinstance(el, str):
-            if el.startswith("file://"):
-                sound_samples[el] = pygame.mixer.Sound(el.removeprefix("file://"))
-
-            if el != "_" and el not in sound_samples:
-                assets_base_path = "assets"
-                sample_path = os.path.join(
-                    assets_base_path, cfg_data["options"]["language"], f"{el}.ogg"
-                )
-                if not os.path.isfile(sample_path):
-                    logger.warning(
-                        f"{COLOR_FAIL}Couldn't find %s{COLOR_ENDC}", sample_path
-                    )
-                    sound_samples[el] = pygame.mixer.Sound(
-                        os.path.join(
-                            assets_base_path,
-                            cfg_data["options"]["language"],
-                            "beep.ogg",
-                        )
-                    )
-                else:
-                    sound_samples[el] = pygame.mixer.Sound(sample_path)
-        else:
-            logger.error("Unsupported sample type: %s (sample %s)", type(el), el)
-    return sound_samples
+def output_sound(pcm):
+    """Makes a sound of mono ``pcm``. The whole pipeline is mono, it's upmixed
+    here only if the mixer has more channels."""
+    channels = pygame.mixer.get_init()[2]
+    if channels > 1:
+        pcm = numpy.repeat(pcm[:, numpy.newaxis], channels, axis=1)
+    return pygame.sndarray.make_sound(pcm)
 
 
-if __name__ == "__main__":
-    message = []
-    args = parse_args()
+def play_ctcss(freq, volume, length):
+    """Plays ``length`` seconds of CTCSS tone on its own mixer channel."""
+    sampling_freq = pygame.mixer.get_init()[0]
+    tone = ctcssTone(freq, round(length * sampling_freq), sampling_freq, volume * 1000)
+    ctcss = output_sound(tone)
+    logger.info(f"{COLOR_WARNING}Playing CTCSS tone %.1fHz{COLOR_ENDC}\n", freq)
+    ctcss.play()
+    return ctcss
+
+
+def mix_ctcss(pcm, freq, volume):
+    """Mixes CTCSS tone into the rendered bulletin."""
+    sampling_freq = pygame.mixer.get_init()[0]
+    tone = ctcssTone(freq, len(pcm), sampling_freq, volume * 1000)
+    logger.info(f"{COLOR_WARNING}Mixing CTCSS tone %.1fHz{COLOR_ENDC}", freq)
+    mixed = pcm.astype(numpy.int32) + tone
+    return numpy.clip(mixed, -32768, 32767).astype(numpy.int16)
+
+
+def sample_path(name):
+    """Returns path of the file of sample ``name`` (or of a ``file://`` URL)."""
+    if name.startswith("file://"):
+        return name.removeprefix("file://")
+    language = cfg_data["options"]["language"]
+    return os.path.join(ASSETS_BASE_PATH, language, f"{name}.ogg")
+
+
+def generate_sample(name):
+    """Returns PCM (mono) of a generated sample ``name``, i.e. a ``cw://`` text
+    sent with ``[cw_id]`` settings, or ``None`` for other samples."""
+    if not name.startswith("cw://"):
+        return None
+    cw_cfg = cfg_data.get("cw_id", {})
+    return cw.cw(
+        name.removeprefix("cw://"),
+        wpm=cw_cfg.get("wpm", 25),
+        farnsworth=cw_cfg.get("farnsworth"),
+        pitch=cw_cfg.get("pitch", 600),
+        volume=cw_cfg.get("volume", 0.1),
+        sampleRate=pygame.mixer.get_init()[0],
+    )
 
-    config_toml_path = "config.toml"
-    if args.config:
-        config_toml_path = args.config
 
-    with open(config_toml_path, "rb") as f:
-        cfg_data = tomllib.load(f)
+def prepare_sample_dictionary(message, sample_bank=None, sound_samples=None):
+    """Loads all samples used in ``message`` as mono PCM arrays at mixer's
+    sampling rate, keyed by sample ids.
+
+    CW texts are generated, other samples are taken from ``sample_bank`` if
+    possible, otherwise they're decoded from ``assets/<language>/*.ogg`` files
+    and trimmed and amplified according to ``sample_levels``.
+    Samples already present in ``sound_samples`` (samples cache, kept between
+    bulletins in daemon mode) aren't loaded again.
+    """
+    if sound_samples is None:
+        sound_samples = {}
+    for sample_id in message.sample_ids():
+        if sample_id in sound_samples:
+            continue
+
+        el = segments.name(sample_id)
+        generated = generate_sample(el)
+        if generated is not None:
+            sound_samples[sample_id] = generated
+            continue
+        if sample_bank is not None and el in sample_bank:
+            sound_samples[sample_id] = sample_bank[el]
+            continue
+
+        path = sample_path(el)
+        if not os.path.isfile(path):
+            logger.warning(f"{COLOR_FAIL}Couldn't find %s{COLOR_ENDC}", path)
+            if sample_bank is not None and "beep" in sample_bank:
+                sound_samples[sample_id] = sample_bank["beep"]
+                continue
+            el = "beep"
+            path = sample_path(el)
+        sound_samples[sample_id] = sample_levels.apply(
+            el, decode_sample(path), pygame.mixer.get_init()[0]
+        )
+    return sound_samples
 
-    logger = setup_logging(cfg_data["log"], debug=args.debug)
 
-    logger.info(f"{COLOR_WARNING}sr0wx.py started{COLOR_ENDC}")
-    logger.info(f"{Fore.BLUE}{LICENSE}{Style.RESET_ALL}")
+def message_pieces(message, sound_samples):
+    """Returns ``(length in frames, mono PCM or None for silence)`` of every
+    segment of ``message``."""
+    sampling_freq = pygame.mixer.get_init()[0]
+
+    pieces = []
+    for kind, value in message:
+        if kind == segments.SILENCE:
+            pieces.append((sampling_freq * value // 1000, None))
+        elif kind == segments.PCM:
+            pcm = mono(message.pcm[value])
+            pieces.append((len(pcm), pcm))
+        elif value in sound_samples:
+            pieces.append((len(sound_samples[value]), sound_samples[value]))
+    return pieces
+
+
+def render_message(message, sound_samples):
+    """Renders the whole message into one contiguous int16 mono PCM buffer.
+
+    Samples are placed back to back, silence segments are left zeroed and arrays
+    given by modules are put inline, so there are no gaps between words.
+    """
+    pieces = message_pieces(message, sound_samples)
+    buffer = numpy.zeros(sum(frames for frames, _ in pieces), numpy.int16)
+    position = 0
+    for frames, pcm in pieces:
+        if pcm is not None:
+            buffer[position : position + frames] = pcm
+        position += frames
+    return buffer
+
+
+def load_modules(lang_module, selected_modules=None):
+    """Imports and configures enabled plugins, optionally limited to
+    ``selected_modules``. Other plugins aren't imported at all."""
+    modules = []
+    for name, plugin_config in cfg_data["plugins"].items():
+        if not plugin_config["enabled"]:
+            continue
+        if selected_modules and name not in selected_modules:
+            continue
+        # import and configure plugin module
+        try:
+            m = plugins.load(name)
+        except KeyError:
+            logger.error(f"{COLOR_FAIL}Unknown plugin %s{COLOR_ENDC}", name)
+            continue
+        combined_config = cfg_data["location"].copy()
+        combined_config["language"] = lang_module
+        combined_config.update(plugin_config)
+        plugin = m.create(combined_config)
+        modules.append(plugin)
 
-    ptt = PTT(
-        cfg_data["serial"]["port"],
-        cfg_data["serial"]["baudrate"],
-        cfg_data["serial"]["ptt_signal"],
-        args.test_mode,
+    logger.debug("Used modules: %s", modules)
+    return modules
+
+
+def profile_startup():
+    """Runs sr0wx again with the same arguments and ``PYTHONPROFILEIMPORTTIME``
+    (same as ``-X importtime``) set, and prints a report of the slowest imports.
+    Returns its exit code.
+
+    The run is in test mode, so it never keys PTT, and it isn't a daemon, so it
+    ends after one bulletin."""
+    argv = [arg for arg in sys.argv[1:] if arg not in ("--startup-profile", "--daemon")]
+    if "-t" not in argv and "--test-mode" not in argv:
+        argv.append("-t")
+    command = [sys.executable, *argv]
+    if not getattr(sys, "frozen", False):
+        # the executable of a PyInstaller build is sr0wx itself
+        command.insert(1, sys.argv[0])
+    result = subprocess.run(
+        command,
+        stderr=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "PYTHONPROFILEIMPORTTIME": "1"},
+    )
+    imports = startup_profile.parse(result.stderr)
+    # pass through everything else the run wrote to stderr
+    sys.stderr.writelines(
+        line
+        for line in result.stderr.splitlines(keepends=True)
+        if not line.startswith("import time:")
     )
+    if imports:
+        print(startup_profile.report(imports))
+    else:
+        print("No import times reported (is this a frozen build?)")
+    return result.returncode
 
-    lang_module = importlib.import_module(f"speech.{cfg_data['options']['language']}")
 
-    modules = []
-    for name, plugin_config in cfg_data["plugins"].items():
-        if plugin_config["enabled"]:
-            # import and configure plugin module
-            m = importlib.import_module(f"plugins.{name}")
-            combined_config = cfg_data["location"].copy()
-            combined_config["language"] = lang_module
-            combined_config.update(plugin_config)
-            plugin = m.create(combined_config)
-            modules.append(plugin)
-
-    logger.debug("Loaded modules: %s", modules)
-    if args.modules:
-        modules = [m for m in modules if m.__module__.split(".")[-1] in args.modules]
-    logger.debug("Used modules: %s", modules)
+def compose_message(modules, sample_bank=None, sound_samples=None):
+    """Collects data from ``modules`` and wraps it into a complete bulletin.
 
-    is_connected = test_internet_connection()
-    if not is_connected:
-        modules = []
-        message.extend(DATA_SOURCES_ERROR_MSG)
-        logger.error(f"{COLOR_FAIL}No internet connection{COLOR_ENDC}\n")
+    The station's callsign is sent in Morse code at the end if ``[cw_id]`` is
+    enabled. If ``max_airtime`` is set in ``[playback]``, messages of plugins of the
+    lowest ``priority`` are trimmed or dropped until the bulletin fits. Its
+    length is computed from sample lengths (``sample_bank`` and already loaded
+    ``sound_samples`` are used if given), nothing is decoded.
+    """
+    # reachability of data sources is learned from modules' own requests
+    http_client.reset_reachability()
 
     # sources = []
     # lang = my_import('.'.join((config.lang, config.lang)))
     # sources = [lang.source, ]
 
-    message, sources = collect_messages(modules)
+    with metrics.current.phase("collection"):
+        parts = collect_messages(modules)
+
+    unreachable = http_client.unreachable_hosts()
+    if unreachable:
+        logger.error(
+            f"{COLOR_FAIL}Unreachable data sources: %s{COLOR_ENDC}",
+            ", ".join(sorted(unreachable)),
+        )
+    if modules and not any(message for _, message, _ in parts) and unreachable:
+        error_message = segments.Message.from_list(DATA_SOURCES_ERROR_MSG, PAUSE_LENGTH)
+        parts = [(None, error_message, "")]
+
+    hello = segments.Message.from_list(HELLO_MSG, PAUSE_LENGTH)
+    goodbye = segments.Message.from_list(GOODBYE_MSG, PAUSE_LENGTH)
+    cw_cfg = cfg_data.get("cw_id", {})
+    if cw_cfg.get("enabled", False):
+        goodbye.append_silence(PAUSE_LENGTH)
+        goodbye.append_cw(cw_cfg["text"])
+    sampling_frequency = pygame.mixer.get_init()[0]
+    durations = airtime.SampleDurations(
+        sampling_frequency,
+        sample_path,
+        sample_bank,
+        sound_samples,
+        generate_sample,
+        sample_levels,
+        decode_sample,
+    )
 
-    # When all the modules finished its work it's time to ``.split()`` returned
-    # data. Every element of returned list is actually a filename of a sample.
+    def sources_message():
+        sources = [source for _, message, source in parts if message and source]
+        if cfg_data["playback"]["read_sources"] and len(sources) > 1:
+            return segments.Message.from_list(sources, PAUSE_LENGTH)
+        return segments.Message()
+
+    max_airtime = cfg_data["playback"].get("max_airtime", 0)
+    if max_airtime:
+        fixed = hello + sources_message() + goodbye
+        budget = round(max_airtime * sampling_frequency) - fixed.frames(
+            durations, sampling_frequency
+        )
+        plugins_cfg = cfg_data["plugins"]
+        messages = airtime.plan(
+            [
+                (name, plugins_cfg.get(name, {}).get("priority", 0), message)
+                for name, message, _ in parts
+            ],
+            budget,
+            durations,
+        )
+        parts = [
+            (name, message, source)
+            for (name, _, source), message in zip(parts, messages)
+        ]
 
-    message = HELLO_MSG + message
-    if cfg_data["playback"]["read_sources"]:
-        if len(sources) > 1:
-            message.extend(sources)
-    message.extend(GOODBYE_MSG)
+    bulletin = hello
+    for _, message, _ in parts:
+        bulletin.extend(message)
+    bulletin.extend(sources_message())
+    bulletin.extend(goodbye)
+    logger.info(
+        "planned airtime: %.1fs",
+        bulletin.frames(durations, sampling_frequency) / sampling_frequency,
+    )
+    return bulletin
 
-    # It's time to init ``pygame``'s mixer (and ``pygame``).
 
-    pygame.mixer.init(cfg_data["playback"]["sampling_frequency"], -16, 2, 1024)
+def render_bulletin(message, sample_bank=None, sound_samples=None):
+    """Loads samples used in ``message`` and renders it into a PCM buffer."""
 
     # Next (as a tiny timesaver & memory eater ;) program loads all necessary
     # samples into memory. I think that this is better approach than reading
@@ -307,81 +568,338 @@ if __name__ == "__main__":
 
     # Just for debug: our playlist (whole message as a list of filenames)
 
-    playlist = []
-
-    for el in message:
-        if isinstance(el, str):
-            playlist.append(el)
-        else:
-            playlist.append("[sndarray]")
-
-    if "ctcss" in cfg_data:
-        play_ctcss(cfg_data["ctcss"]["tone"], cfg_data["ctcss"]["volume"])
+    logger.info("playlist elements: %s", message.playlist() + "\n")
+    logger.info("loading sound samples...")
 
-    logger.info("playlist elements: %s", " ".join(playlist) + "\n")
+    with metrics.current.phase("samples"):
+        sound_samples = prepare_sample_dictionary(message, sample_bank, sound_samples)
+    with metrics.current.phase("render"):
+        pcm = render_message(message, sound_samples)
+    if cfg_data.get("ctcss", {}).get("mix", False):
+        pcm = mix_ctcss(pcm, cfg_data["ctcss"]["tone"], cfg_data["ctcss"]["volume"])
+    sampling_frequency = pygame.mixer.get_init()[0]
+    metrics.current.airtime = len(pcm) / sampling_frequency
+    logger.info("bulletin length: %.1fs", metrics.current.airtime)
+    return pcm
+
+
+def bulletin_sounds(message, sample_bank=None, sound_samples=None):
+    """Loads samples used in ``message`` and returns its segments as separate
+    sounds, for queued playback."""
+    logger.info("playlist elements: %s", message.playlist() + "\n")
     logger.info("loading sound samples...")
 
-    sound_samples = prepare_sample_dictionary()
+    with metrics.current.phase("samples"):
+        sound_samples = prepare_sample_dictionary(message, sample_bank, sound_samples)
+    sounds = [
+        output_sound(pcm if pcm is not None else numpy.zeros(frames, numpy.int16))
+        for frames, pcm in message_pieces(message, sound_samples)
+        if frames
+    ]
+    metrics.current.airtime = sum(sound.get_length() for sound in sounds)
+    logger.info("bulletin length: %.1fs", metrics.current.airtime)
+    return sounds
+
+
+def play_queued(sounds):
+    """Plays ``sounds`` back to back on one channel.
+
+    The next sound is always queued while the current one plays, so the mixer
+    switches to it without a gap. In the meantime the program sleeps until the
+    queued sound is due to start, instead of polling the channel.
+    """
+    if not sounds:
+        return
+    channel = pygame.mixer.find_channel(True)
+    underruns = 0
+    # how late the mixer switched to each queued sound, in seconds
+    switches = []
+    boundary = 0.0  # when the queued sound starts, in seconds from the start
+    started = time.perf_counter()
+    channel.play(sounds[0])
+    for previous, sound in zip(sounds, sounds[1:]):
+        if not channel.get_busy():
+            underruns += 1
+        channel.queue(sound)
+        boundary += previous.get_length()
+        remaining = boundary - (time.perf_counter() - started)
+        pygame.time.wait(max(round(remaining * 1000), 0))
+        while channel.get_queue() is not None:
+            pygame.time.wait(QUEUE_MARGIN)
+        # the queue is empty once the mixer has taken the sound, which is seen
+        # with a resolution of QUEUE_MARGIN
+        switches.append(max(time.perf_counter() - started - boundary, 0))
+
+    remaining = boundary + sounds[-1].get_length() - (time.perf_counter() - started)
+    pygame.time.wait(max(round(remaining * 1000), 0))
+    while channel.get_busy():
+        pygame.time.wait(QUEUE_MARGIN)
+
+    if switches:
+        logger.info(
+            "queued sounds started up to %.1fms (%.1fms on average) late, "
+            "measured every %dms; %d underruns",
+            max(switches) * 1000,
+            sum(switches) * 1000 / len(switches),
+            QUEUE_MARGIN,
+            underruns,
+        )
+
+
+def save_bulletin(path, pcm):
+    """Writes rendered (mono) bulletin to a WAV or OGG (encoded with ``ffmpeg``)
+    file, with as many channels as the mixer has."""
+    sampling_frequency, _, channels = pygame.mixer.get_init()
+    if channels > 1:
+        pcm = numpy.repeat(pcm[:, numpy.newaxis], channels, axis=1)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".wav":
+        with wave.open(path, "wb") as f:
+            f.setnchannels(channels)
+            f.setsampwidth(2)
+            f.setframerate(sampling_frequency)
+            f.writeframes(pcm.astype("<i2").tobytes())
+    elif extension == ".ogg":
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "s16le",
+                "-ar",
+                str(sampling_frequency),
+                "-ac",
+                str(channels),
+                "-i",
+                "-",
+                "-acodec",
+                "libvorbis",
+                path,
+            ],
+            input=pcm.astype("<i2").tobytes(),
+            check=True,
+        )
+    else:
+        raise ValueError(f"Unsupported output format: {path}")
+    logger.info(f"{COLOR_OKGREEN}bulletin saved to %s{COLOR_ENDC}", path)
+
+
+def transmit(message, ptt, sample_bank=None, sound_samples=None):
+    """Plays ``message`` on air. ``pygame``'s mixer has to be initialized.
+
+    In ``"queue"`` playback mode, segments are played as separate sounds queued
+    one after another, otherwise the whole bulletin is rendered into one sound.
+    """
+    queued = cfg_data["playback"].get("mode", "buffer") == "queue"
+    if queued and cfg_data.get("ctcss", {}).get("mix", False):
+        logger.warning("CTCSS can't be mixed into queued samples, rendering")
+        queued = False
+    if queued:
+        sounds = bulletin_sounds(message, sample_bank, sound_samples)
+        length = metrics.current.airtime
+    else:
+        bulletin = output_sound(render_bulletin(message, sample_bank, sound_samples))
+        length = bulletin.get_length()
+
+    ctcss = None
+    if "ctcss" in cfg_data and not cfg_data["ctcss"].get("mix", False):
+        # long enough to cover PTT delays before and after the bulletin
+        ctcss = play_ctcss(
+            cfg_data["ctcss"]["tone"],
+            cfg_data["ctcss"]["volume"],
+            length + 3,
+        )
 
     # Program should be able to "press PTT" via RSS232. See ``config`` for
-    # details.
-
-    ptt.press()
-
-    pygame.time.delay(1000)
-
-    # OK, data prepared, samples loaded, let the party begin!
-    #
-    # Take a look at ``while`` condition -- program doesn't check if the
-    # sound had finished played all the time, but only 25 times/sec (default).
-    # It is because I don't want 100% CPU usage. If you don't have as fast CPU
-    # as mine (I think you have, though) you can always lower this value.
-    # Unfortunately, there may be some pauses between samples so "reading
-    # aloud" will be less natural.
-
-    logger.info("playing sound samples\n")
-    voice_channel = None
-    for el in message:
-        # print el # wyświetlanie nazw próbek
-        logger.debug("Sample: %s", el)
-        if el == "_":
-            # pause
-            pygame.time.wait(500)
-        else:
-            if isinstance(el, str):
-                # sample name
-                with contextlib.suppress(Exception):
-                    voice_channel = sound_samples[el].play()
-            elif isinstance(el, numpy.ndarray):
-                # sample in an array form
-                sound = pygame.sndarray.make_sound(el)
-                if cfg_data["options"]["pygame_bugfix"]:
-                    sound = pygame.sndarray.make_sound(
-                        pygame.sndarray.array(sound)[
-                            : len(pygame.sndarray.array(sound)) / 2
-                        ]
-                    )
-                voice_channel = sound.play()
+    # details. Whatever happens from now on, the transmitter mustn't stay keyed.
+
+    try:
+        with metrics.current.phase("ptt_lead"):
+            ptt.press()
+
+            pygame.time.delay(1000)
+
+        # OK, data prepared, samples loaded, let the party begin!
+        #
+        # The whole message is rendered into a single buffer first and played
+        # back as one sound, so there are no pauses between samples and program
+        # doesn't have to check if the sound had finished every few milliseconds.
+
+        logger.info("playing sound samples\n")
+        with metrics.current.phase("playback"):
+            if queued:
+                play_queued(sounds)
             else:
-                logger.error("Unsupported sample type: %s (sample %s)", type(el), el)
+                bulletin.play()
+                pygame.time.wait(round(bulletin.get_length() * 1000))
+
+        # The following four lines give us a one second break (for CTCSS, PTT and
+        # other stuff) before closing the ``pygame`` mixer and display some debug
+        # informations.
 
-            if voice_channel:
-                # wait until playback finishes
-                while voice_channel.get_busy():
-                    pygame.time.Clock().tick(25)
+        logger.info(f"{COLOR_WARNING}finishing in 1 second...\n{COLOR_ENDC}")
 
-    # Possibly the argument of ``pygame.time.Clock().tick()`` should be in
-    # config file...
-    #
-    # The following four lines give us a one second break (for CTCSS, PTT and
-    # other stuff) before closing the ``pygame`` mixer and display some debug
-    # informations.
+        pygame.time.delay(1000)
+    finally:
+        ptt.release()
+        if ctcss is not None:
+            ctcss.stop()
+
+
+def write_metrics():
+    """Exports metrics of the current run to files given in ``[metrics]``."""
+    metrics_cfg = cfg_data.get("metrics", {})
+    try:
+        if "textfile" in metrics_cfg:
+            metrics.current.write_textfile(metrics_cfg["textfile"])
+        if "json" in metrics_cfg:
+            metrics.current.write_json(metrics_cfg["json"])
+    except OSError:
+        logger.exception(f"{COLOR_FAIL}Couldn't write metrics{COLOR_ENDC}")
+
+
+def run_daemon(modules, ptt, sample_bank=None):
+    """Transmits bulletins according to the schedule, forever.
+
+    Mixer, plugins, sample bank and loaded samples are created once and kept
+    between bulletins, so every transmission starts right away.
+    """
+    schedule = cfg_data.get("daemon", {}).get("schedule")
+    if schedule:
+        scheduler = Scheduler(schedule)
+    else:
+        hour_quarter = (
+            cfg_data["plugins"].get("activity_map", {}).get("hour_quarter", 0)
+        )
+        scheduler = Scheduler.from_hour_quarter(hour_quarter)
 
-    logger.info(f"{COLOR_WARNING}finishing in 1 second...\n{COLOR_ENDC}")
+    sound_samples = {}
+    while True:
+        next_run = scheduler.next_run(datetime.datetime.now())
+        logger.info(f"{COLOR_OKBLUE}next bulletin at %s{COLOR_ENDC}", next_run)
+        while (delay := (next_run - datetime.datetime.now()).total_seconds()) > 0:
+            time.sleep(delay)
+
+        metrics.new_run()
+        try:
+            transmit(
+                compose_message(modules, sample_bank, sound_samples),
+                ptt,
+                sample_bank,
+                sound_samples,
+            )
+        except Exception:
+            logger.exception(f"{COLOR_FAIL}Bulletin failed{COLOR_ENDC}")
+        write_metrics()
 
-    pygame.time.delay(1000)
 
-    ptt.release()
+if __name__ == "__main__":
+    metrics.current.add_phase("imports", IMPORT_TIME)
+    args = parse_args()
+    if args.startup_profile:
+        raise SystemExit(profile_startup())
+
+    config_toml_path = "config.toml"
+    if args.config:
+        config_toml_path = args.config
+
+    with metrics.current.phase("config"):
+        with open(config_toml_path, "rb") as f:
+            cfg_data = tomllib.load(f)
+
+        logger = setup_logging(cfg_data["log"], debug=args.debug)
+
+    logger.info(f"{COLOR_WARNING}sr0wx.py started{COLOR_ENDC}")
+    logger.info(f"{COLOR_OKBLUE}{LICENSE}{COLOR_ENDC}")
+
+    if args.output or args.analyse_samples or args.build_bank:
+        # mixer is used only to decode samples, no sound card needed
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    with metrics.current.phase("imports"):
+        import numpy
+        import pygame
+
+        from lib import airtime, cw, segments
+        from lib.ctcss import ctcssTone
+        from lib.sample_bank import (
+            SampleBank,
+            build as build_sample_bank,
+            decode_sample,
+            mono,
+        )
+        from lib.sample_levels import SampleLevels, analyse as analyse_samples
+
+    language = cfg_data["options"]["language"]
+    if args.analyse_samples:
+        pygame.mixer.init(cfg_data["playback"]["sampling_frequency"], -16, 1, 1024)
+        analyse_samples(ASSETS_BASE_PATH, language)
+        raise SystemExit
+
+    sample_levels = SampleLevels.open(ASSETS_BASE_PATH, language)
+    if args.build_bank:
+        pygame.mixer.init(
+            cfg_data["playback"]["sampling_frequency"],
+            -16,
+            cfg_data["playback"].get("channels", 1),
+            1024,
+        )
+        build_sample_bank(ASSETS_BASE_PATH, language, sample_levels)
+        raise SystemExit
+
+    with metrics.current.phase("imports"):
+        from lib import http_cache, http_client
+
+    if "http" in cfg_data:
+        http_client.configure(**cfg_data["http"])
+    if "http_cache" in cfg_data:
+        http_cache.configure(
+            cfg_data["http_cache"]["directory"],
+            cfg_data["http_cache"]["max_size"] * 1024 * 1024,
+            cfg_data["http_cache"].get("stale_factor", 3),
+        )
+
+    lang_module = importlib.import_module(f"speech.{language}")
+    modules = load_modules(lang_module, args.modules)
+
+    # It's time to init ``pygame``'s mixer.
+
+    pygame.mixer.init(
+        cfg_data["playback"]["sampling_frequency"],
+        -16,
+        cfg_data["playback"].get("channels", 1),
+        1024,
+    )
+    sample_bank = SampleBank.open(
+        ASSETS_BASE_PATH, language, pygame.mixer.get_init()[0]
+    )
+
+    if args.output:
+        save_bulletin(
+            args.output,
+            render_bulletin(compose_message(modules, sample_bank), sample_bank),
+        )
+        write_metrics()
+        raise SystemExit
+
+    from hw.ptt import PTT
+
+    ptt = PTT(
+        cfg_data["serial"]["port"],
+        cfg_data["serial"]["baudrate"],
+        cfg_data["serial"]["ptt_signal"],
+        args.test_mode,
+    )
+
+    if args.daemon:
+        # SDL swallows SIGTERM, let it stop the daemon just like Ctrl+C does
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        with contextlib.suppress(KeyboardInterrupt):
+            run_daemon(modules, ptt, sample_bank)
+    else:
+        transmit(compose_message(modules, sample_bank), ptt, sample_bank)
+        write_metrics()
 
     logger.info(f"{COLOR_WARNING}goodbye{COLOR_ENDC}")
 
@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,7 +7,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['speech', 'plugins'],
+    # plugins are imported by name at runtime, nothing imports them statically
+    hiddenimports=['speech', 'plugins'] + collect_submodules('plugins'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
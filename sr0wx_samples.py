@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+# sr0wx_samples.py - generates voice samples of sr0wx from a manifest
+#
+# Samples (file names and texts to read) and the voice are described in
+# ``audio_generator/manifest.toml``. Only samples which are new or whose text,
+# voice or encoding changed are synthesized, see ``lib/sample_generator.py``.
+
+import argparse
+import logging
+import time
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from lib import sample_generator
+
+MANIFEST_PATH = "audio_generator/manifest.toml"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-m", "--manifest", default=MANIFEST_PATH, help="Path to the manifest"
+    )
+    parser.add_argument(
+        "-o", "--output", help="Directory to write samples to, instead of manifest's"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of samples synthesized at once (number of CPUs by default)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=sample_generator.CACHE_DIRECTORY,
+        help="Directory of synthesized samples cache",
+    )
+    parser.add_argument(
+        "names", metavar="NAME", nargs="*", help="Limit samples to generate"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    with open(args.manifest, "rb") as f:
+        manifest = tomllib.load(f)
+    if args.output:
+        manifest["voice"]["output"] = args.output
+
+    started = time.monotonic()
+    synthesized, updated, failed = sample_generator.generate(
+        manifest, set(args.names), args.jobs, args.cache
+    )
+    logging.info(
+        "%i samples synthesized, %i updated in %s, %i failed in %.1fs",
+        synthesized,
+        updated,
+        manifest["voice"]["output"],
+        failed,
+        time.monotonic() - started,
+    )
+    raise SystemExit(1 if failed else 0)